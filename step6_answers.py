@@ -0,0 +1,102 @@
+from collections.abc import MutableMapping
+from functools import cache
+
+from step7_artifact import load_artifact
+from step7_bitset import ANSWER_BITS, answer_bits, build_key_index
+
+# ===== Step 6 답변 저장소 (st.session_state.step6_selections) =====
+# 키 레지스트리(step6_used_key_info.csv) 순서의 고정 위치마다 답변 코드 1바이트를 둔다.
+# 긴 문자열 키와 한글 값을 세션마다 보관하지 않고, dict 와 같은 방식으로 읽고 쓸 수 있다.
+# 바이트 배열은 첫 답변이 기록될 때 할당되므로 Step 1–5 에서는 규칙 아티팩트를 읽지 않는다.
+
+# 코드 = 위치, 0 = 미응답
+ANSWER_CODES = ("", "변경 있음", "변경 없음", "충족", "미충족")
+
+ANSWER_CODE_OF = {answer: code for code, answer in enumerate(ANSWER_CODES) if answer}
+
+# 코드 → step7_bitset 의 2비트 값 (키 종류에 맞는 값만 저장되므로 종류와 무관하게 정해진다)
+_CODE_BITS = tuple(
+    ANSWER_BITS["sub"].get(answer) or ANSWER_BITS["req"].get(answer, 0) for answer in ANSWER_CODES
+)
+
+
+# 키 레지스트리 : 위치 = 비트 위치 = 답변 코드 위치
+@cache
+def step6_keys():
+    return tuple(load_artifact("rules")["step6_keys"])
+
+
+@cache
+def step6_key_index():
+    return build_key_index(step6_keys())
+
+
+class Step6Answers(MutableMapping):
+    __slots__ = ("_codes",)
+
+    def __init__(self, selections=None):
+        self._codes = bytearray()
+        if selections:
+            self.update(selections)
+
+    def _position(self, key):
+        position = step6_key_index().get(key)
+        if position is None:
+            raise KeyError(key)
+        return position
+
+    def __getitem__(self, key):
+        if not self._codes:
+            raise KeyError(key)
+        code = self._codes[self._position(key)]
+        if not code:
+            raise KeyError(key)
+        return ANSWER_CODES[code]
+
+    def get(self, key, default=None):
+        if not self._codes:
+            return default
+        position = step6_key_index().get(key)
+        if position is None or not self._codes[position]:
+            return default
+        return ANSWER_CODES[self._codes[position]]
+
+    def __setitem__(self, key, value):
+        position = self._position(key)
+        code = ANSWER_CODE_OF.get(value)
+        if code is None or value not in answer_bits(key):
+            raise ValueError(f"{key} 에 허용되지 않는 값 {value!r}")
+        if not self._codes:
+            self._codes = bytearray(len(step6_keys()))
+        self._codes[position] = code
+
+    def __delitem__(self, key):
+        if not self._codes or not self._codes[self._position(key)]:
+            raise KeyError(key)
+        self._codes[self._position(key)] = 0
+
+    def __iter__(self):
+        if not self._codes:
+            return iter(())
+        keys = step6_keys()
+        return (keys[position] for position, code in enumerate(self._codes) if code)
+
+    def __len__(self):
+        return len(self._codes) - self._codes.count(0)
+
+    def __repr__(self):
+        return f"Step6Answers({dict(self.items())!r})"
+
+    def codes_at(self, positions):
+        # 지정한 레지스트리 위치의 답변 코드 (판정 지문용)
+        if not self._codes:
+            return bytes(len(positions))
+        return bytes(self._codes[position] for position in positions)
+
+    def vector(self):
+        # step7_bitset.encode_selections 와 같은 비트 벡터를 문자열 비교 없이 생성
+        vector = 0
+        for position, code in enumerate(self._codes):
+            if code:
+                vector |= _CODE_BITS[code] << (2 * position)
+        return vector
@@ -0,0 +1,108 @@
+import argparse
+import hashlib
+import json
+import sys
+from functools import cache
+from pathlib import Path
+
+# ===== 항목 카탈로그 · 규칙 표 아티팩트 =====
+# step_items.py / step7_rows.py / step6_used_key_info.csv 를 원본으로
+# 미리 정규화·검증한 JSON 아티팩트를 만들어 두고, 실행 시에는 필요한 아티팩트만
+# 프로세스당 한 번 읽는다. Step 1–5 는 규칙 아티팩트를 읽지 않는다.
+#
+# 파일 형식 : 첫 줄 헤더 "STEP7-ARTIFACT/<형식 버전> <이름> sha256=<본문 해시>" + JSON 본문
+#
+#     python step7_artifact.py            # 아티팩트 갱신
+#     python step7_artifact.py --check    # 아티팩트가 원본과 같은지 확인 (빌드 단계)
+
+MAGIC = "STEP7-ARTIFACT"
+FORMAT_VERSION = 1
+
+ARTIFACT_PATHS = {
+    "catalog": Path(__file__).with_name("step_catalog.artifact.json"),
+    "rules": Path(__file__).with_name("step7_rules.artifact.json"),
+}
+
+
+def _digest(payload, name):
+    # rules 는 규칙 표만 해시하여 step7_compiled.TABLE_DIGEST 와 같은 값을 사용
+    body = payload["table"] if name == "rules" else payload
+    return hashlib.sha256(json.dumps(body, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def build_payload(name):
+    # 원본 모듈은 아티팩트를 만들 때만 불러온다
+    if name == "catalog":
+        from step_items import step5_items, step6_fixed_subitems, step6_items, step6_sync_pairs
+
+        return {
+            "step5_items": step5_items,
+            "step6_items": step6_items,
+            "step6_sync_pairs": step6_sync_pairs,
+            "step6_fixed_subitems": list(step6_fixed_subitems),
+        }
+    if name == "rules":
+        from step7_bitset import load_step6_key_title_keys, load_step6_keys
+        from step7_documents import build_document_catalog
+        from step7_normalize import COLUMNS, normalize_rows
+        from step7_rows import STEP7_ROWS
+
+        table = normalize_rows(STEP7_ROWS)
+        documents, row_documents = build_document_catalog(table)
+        return {
+            "columns": list(COLUMNS),
+            "table": [[row[column] for column in COLUMNS] for row in table],
+            "documents": documents,
+            "row_documents": row_documents,
+            "step6_keys": list(load_step6_keys()),
+            "step6_key_title_keys": load_step6_key_title_keys(),
+        }
+    raise ValueError(f"알 수 없는 아티팩트입니다: {name!r}")
+
+
+def render(name, payload):
+    header = f"{MAGIC}/{FORMAT_VERSION} {name} sha256={_digest(payload, name)}"
+    return header + "\n" + json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+@cache
+def load_artifact(name):
+    path = ARTIFACT_PATHS[name]
+    if not path.exists():
+        # 아티팩트가 아직 생성되지 않은 작업 트리에서는 원본에서 바로 만든다
+        payload = build_payload(name)
+        return {"digest": _digest(payload, name), **payload}
+    with open(path, encoding="utf-8") as f:
+        header = f.readline().split()
+        if (
+            len(header) != 3
+            or header[0] != f"{MAGIC}/{FORMAT_VERSION}"
+            or header[1] != name
+            or not header[2].startswith("sha256=")
+        ):
+            raise ValueError(f"{path.name} 의 헤더가 올바르지 않습니다. python step7_artifact.py 로 다시 생성하세요.")
+        payload = json.load(f)
+    return {"digest": header[2][len("sha256="):], **payload}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="항목 카탈로그와 규칙 표 아티팩트를 생성합니다.")
+    parser.add_argument("--check", action="store_true", help="아티팩트가 최신이 아니면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    stale = []
+    for name, path in ARTIFACT_PATHS.items():
+        source = render(name, build_payload(name))
+        if args.check:
+            current = path.read_text(encoding="utf-8") if path.exists() else ""
+            if current != source:
+                stale.append(path.name)
+        else:
+            path.write_text(source, encoding="utf-8")
+    if stale:
+        print(f"{', '.join(stale)} 가 원본과 다릅니다. python step7_artifact.py 로 다시 생성하세요.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+from step6_answers import step6_key_index
+from step7_engine import compile_rules, rule_conditions, step7_table
+from step7_summary import REPORT_TAG_ORDER, row_tag_ranks
+
+# ===== Step 7 일괄 판정 (DataFrame) =====
+# answers : 한 행이 하나의 답변 세트, 열 이름은 step6_selections 키
+#           (step7_bitset.load_step6_keys() 와 동일한 키 형식)
+# hits    : answers.index × STEP7_ROWS 위치(0-based) 의 bool 행렬
+# tags    : answers.index × title_key 의 output_1_tag 순서형 범주 열 (AR < IR < Cmin < Cmaj)
+#           여러 행이 충족되면 가장 엄격한 태그, 해당 행이 없으면 결측
+
+
+def evaluate_hits(answers):
+    n = len(answers)
+    key_index = step6_key_index()
+    comparisons = {}
+
+    # 같은 (key, value) 비교는 한 번만 계산해 모든 규칙이 공유
+    def column_equals(key, value):
+        pair = (key, value)
+        if pair not in comparisons:
+            if key in answers.columns and key in key_index:
+                comparisons[pair] = answers[key].eq(value).to_numpy(
+                    dtype=bool, na_value=False
+                )
+            else:
+                comparisons[pair] = np.zeros(n, dtype=bool)
+        return comparisons[pair]
+
+    # 엔진이 충족될 수 없다고 보는 행(마스크 None : 레지스트리 밖 키 등)은 판정하지 않는다.
+    # 그 밖의 행은 레지스트리 키만 참조하므로 레지스트리에 없는 열은 비교되지 않는다.
+    live = {
+        position
+        for entries in compile_rules().values()
+        for position, mask in entries
+        if mask is not None
+    }
+
+    # 규칙별 열을 연속 메모리로 계산하도록 column-major 배열 사용
+    hits = np.ones((n, len(step7_table())), dtype=bool, order="F")
+    for position, required in enumerate(rule_conditions()):
+        if position not in live:
+            hits[:, position] = False
+            continue
+        for key, value in required:
+            hits[:, position] &= column_equals(key, value)
+    return pd.DataFrame(hits, index=answers.index, columns=range(len(step7_table())))
+
+
+def evaluate_tags(hits):
+    table = step7_table()
+    positions_by_key = {}
+    for position, row in enumerate(table):
+        positions_by_key.setdefault(row["title_key"], []).append(position)
+
+    ranks = np.array(row_tag_ranks())
+    matrix = hits.to_numpy()
+    tags = {}
+    for title_key, positions in positions_by_key.items():
+        # 충족된 행의 엄격도 중 최댓값 (충족된 행이 없으면 -1 → 결측)
+        codes = np.where(matrix[:, positions], ranks[positions], -1).max(axis=1)
+        tags[title_key] = pd.Categorical.from_codes(
+            codes, categories=REPORT_TAG_ORDER, ordered=True
+        )
+    return pd.DataFrame(tags, index=hits.index)
+
+
+def evaluate_frame(answers):
+    hits = evaluate_hits(answers)
+    return hits, evaluate_tags(hits)
@@ -0,0 +1,91 @@
+import csv
+import re
+from functools import cache
+from pathlib import Path
+
+# ===== Step 6 선택값 비트 인코딩 =====
+# step6_used_key_info.csv 의 키 순서를 고정 비트 위치로 사용한다.
+# 키 하나당 2비트 : 하위 비트 = 응답 여부, 상위 비트 = "변경 있음"(sub) / "충족"(req) 여부
+# 규칙은 (care_mask, expected_bits) 쌍으로 컴파일되며
+# (vector & care_mask) == expected_bits 이면 해당 행이 충족된다.
+
+STEP6_KEY_INFO = Path(__file__).with_name("step6_used_key_info.csv")
+
+# 키 종류(하위항목 sub / 충족요건 req)별 허용 값 : 다른 종류의 값은 응답하지 않은 것으로 본다
+ANSWER_BITS = {
+    "sub": {"변경 있음": 0b11, "변경 없음": 0b01},
+    "req": {"충족": 0b11, "미충족": 0b01},
+}
+
+_KEY_KIND = re.compile(r"_(sub|req)_")
+
+_DECL_PATH = re.compile(
+    r'step6_items\["(\w+)"\]\["(subitems|requirements)"\]\["(\w+)"\]'
+)
+_KIND_INFIX = {"subitems": "sub", "requirements": "req"}
+
+
+def _read_step6_key_info(path):
+    # decl_path 를 실제 st.session_state.step6_selections 키 형식으로 변환 → (키, title_key)
+    with open(path, encoding="utf-8", newline="") as f:
+        for record in csv.DictReader(f):
+            match = _DECL_PATH.fullmatch(record["decl_path"])
+            if match is None:
+                raise ValueError(f"알 수 없는 decl_path 입니다: {record['decl_path']!r}")
+            title_key, kind, item_key = match.groups()
+            yield f"{title_key}_{_KIND_INFIX[kind]}_{item_key}", record["title_key"]
+
+
+def load_step6_keys(path=STEP6_KEY_INFO):
+    return tuple(key for key, _ in _read_step6_key_info(path))
+
+
+def load_step6_key_title_keys(path=STEP6_KEY_INFO):
+    # step6_selections 키 → 그 키를 조건으로 참조하는 title_key
+    return dict(_read_step6_key_info(path))
+
+
+def build_key_index(keys):
+    return {key: position for position, key in enumerate(keys)}
+
+
+@cache
+def answer_bits(key):
+    # 키에 허용되는 값 → 2비트 값 (종류를 알 수 없는 키는 빈 dict)
+    match = _KEY_KIND.search(key)
+    return ANSWER_BITS[match.group(1)] if match else {}
+
+
+def encode_selections(step6_selections, key_index):
+    vector = 0
+    for key, value in step6_selections.items():
+        position = key_index.get(key)
+        bits = answer_bits(key).get(value) if position is not None else None
+        if position is not None and bits is not None:
+            vector |= bits << (2 * position)
+    return vector
+
+
+def compile_mask(required, key_index):
+    # 충족될 수 없는 행은 None :
+    #   레지스트리에 없는 키, 키 종류에 맞지 않는 값, 같은 키에 서로 다른 값을 요구하는 경우
+    care_mask = 0
+    expected_bits = 0
+    wanted = {}
+    for key, value in required:
+        if wanted.setdefault(key, value) != value:
+            return None
+        position = key_index.get(key)
+        bits = answer_bits(key).get(value)
+        if position is None or bits is None:
+            return None
+        care_mask |= 0b11 << (2 * position)
+        expected_bits |= bits << (2 * position)
+    return care_mask, expected_bits
+
+
+def mask_met(vector, mask):
+    if mask is None:
+        return False
+    care_mask, expected_bits = mask
+    return vector & care_mask == expected_bits
@@ -0,0 +1,67 @@
+import argparse
+import io
+import json
+import sys
+
+from step7_engine import evaluate
+from step_pipeline import run_chunks
+
+# ===== Step 7 일괄 판정 CLI (JSON Lines) =====
+# 입력 한 줄 : {"step6_targets": [...], "step6_selections": {...}}
+# 출력 한 줄 : {"step7_results": {title_key: [[output_1_tag, output_1_text, output_2_text], …]}}
+# 빈 줄 · 해석할 수 없는 줄은 {"error": "..."} 를 출력하여 입력 n 번째 줄과 출력 n 번째 줄을 맞춘다.
+#
+#     python step7_cli.py answers.jsonl -o results.jsonl --workers 8
+
+CHUNK_SIZE = 1000
+
+
+def evaluate_line(line):
+    if not line.strip():
+        return json.dumps({"error": "빈 줄입니다"}, ensure_ascii=False)
+    try:
+        record = json.loads(line)
+        results = evaluate(record["step6_selections"], record["step6_targets"])
+    except (ValueError, KeyError, TypeError, AttributeError) as exc:
+        return json.dumps({"error": f"{type(exc).__name__}: {exc}"}, ensure_ascii=False)
+    return json.dumps({"step7_results": results}, ensure_ascii=False)
+
+
+def evaluate_chunk(numbered_lines):
+    return [evaluate_line(line) for _, line in numbered_lines]
+
+
+def run(lines, workers=1, chunk_size=CHUNK_SIZE):
+    return run_chunks(evaluate_chunk, lines, workers, chunk_size)
+
+
+def _open_input(path):
+    if path == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def _open_output(path):
+    if path == "-":
+        return io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Step 6 답변 세트(JSON Lines)에 대한 Step 7 판정 결과를 출력합니다."
+    )
+    parser.add_argument("input", nargs="?", default="-", help="입력 JSONL 파일 (기본값: 표준입력)")
+    parser.add_argument("-o", "--output", default="-", help="출력 JSONL 파일 (기본값: 표준출력)")
+    parser.add_argument("--workers", type=int, default=1, help="병렬 처리 프로세스 수")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="프로세스당 전달할 줄 수")
+    args = parser.parse_args(argv)
+
+    with _open_input(args.input) as source, _open_output(args.output) as sink:
+        for line in run(source, args.workers, args.chunk_size):
+            sink.write(line)
+            sink.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import sys
+from pathlib import Path
+
+from step_items import step6_items
+from step7_engine import compile_rules, rule_conditions, table_digest
+
+# ===== Step 7 판정 모듈 생성기 =====
+# 정규화된 규칙 표로부터 title_key 별 판정 함수를 가진 step7_compiled.py 를 생성한다.
+# 각 함수는 필요한 선택값을 한 번씩 지역 변수로 읽은 뒤 결정 트리로 분기하여
+# 충족되는 행 id(STEP7_ROWS 위치) 튜플을 반환한다.
+# 규칙 표를 수정한 뒤에는 생성 파일을 직접 고치지 말고 다시 생성한다.
+#
+#     python step7_codegen.py            # step7_compiled.py 갱신
+#     python step7_codegen.py --check    # 생성 파일이 최신인지 확인 (빌드 단계)
+
+OUTPUT_PATH = Path(__file__).with_name("step7_compiled.py")
+
+HEADER = '''# 이 파일은 step7_codegen.py 가 생성합니다. 직접 수정하지 마세요.
+#     python step7_codegen.py
+
+TABLE_DIGEST = {digest!r}'''
+
+
+def _decision_tree(rows, done, local_names, indent):
+    # rows : [(행 id, {키: 값})] 아직 확인할 조건이 남은 행
+    # done : 지금까지의 분기에서 조건을 모두 만족한 행 id
+    pad = "    " * indent
+    done = list(done) + [row_id for row_id, cube in rows if not cube]
+    rows = [(row_id, cube) for row_id, cube in rows if cube]
+    if not rows:
+        return [f"{pad}return {tuple(sorted(done))!r}"]
+
+    counts = {}
+    for _, cube in rows:
+        for key in cube:
+            counts[key] = counts.get(key, 0) + 1
+    key = max(counts, key=lambda candidate: (counts[candidate], candidate))
+    values = sorted({cube[key] for _, cube in rows if key in cube})
+    untouched = [(row_id, cube) for row_id, cube in rows if key not in cube]
+
+    lines = []
+    for branch, value in enumerate(values):
+        keyword = "if" if branch == 0 else "elif"
+        lines.append(f"{pad}{keyword} {local_names[key]} == {value!r}:")
+        remaining = list(untouched)
+        for row_id, cube in rows:
+            if cube.get(key) == value:
+                remaining.append((row_id, {k: v for k, v in cube.items() if k != key}))
+        lines.extend(_decision_tree(sorted(remaining), done, local_names, indent + 1))
+    lines.append(f"{pad}else:")
+    lines.extend(_decision_tree(untouched, done, local_names, indent + 1))
+    return lines
+
+
+def _matcher_source(title_key):
+    conditions = rule_conditions()
+    # 충족될 수 없는 행(마스크 None : 응답할 수 없는 키, 같은 키의 서로 다른 값 등)은 생성하지 않는다
+    rows = []
+    for row_id, mask in compile_rules().get(title_key, ()):
+        cube = dict(conditions[row_id])
+        if mask is None or len(cube) != len(conditions[row_id]):
+            continue
+        rows.append((row_id, cube))
+    keys = sorted({key for _, cube in rows for key in cube})
+    local_names = {key: f"v{index}" for index, key in enumerate(keys)}
+
+    lines = [f"def match_{title_key}(step6_selections):"]
+    for key in keys:
+        lines.append(f"    {local_names[key]} = step6_selections.get({key!r})")
+    lines.extend(_decision_tree(rows, [], local_names, 1))
+    return "\n".join(lines)
+
+
+def generate():
+    parts = [HEADER.format(digest=table_digest())]
+    for title_key in step6_items:
+        parts.append(_matcher_source(title_key))
+    matchers = "\n".join(f"    {key!r}: match_{key}," for key in step6_items)
+    parts.append(f"MATCHERS = {{\n{matchers}\n}}")
+    return "\n\n\n".join(parts) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="규칙 표로부터 step7_compiled.py 를 생성합니다.")
+    parser.add_argument("--check", action="store_true", help="생성 파일이 최신이 아니면 종료 코드 1")
+    parser.add_argument("-o", "--output", type=Path, default=OUTPUT_PATH)
+    args = parser.parse_args(argv)
+
+    source = generate()
+    if args.check:
+        current = args.output.read_text(encoding="utf-8") if args.output.exists() else ""
+        if current != source:
+            print(f"{args.output.name} 가 규칙 표와 다릅니다. python step7_codegen.py 로 다시 생성하세요.")
+            sys.exit(1)
+        return
+    args.output.write_text(source, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1261 @@
+# 이 파일은 step7_codegen.py 가 생성합니다. 직접 수정하지 마세요.
+#     python step7_codegen.py
+
+TABLE_DIGEST = 'd88e7edf915dc29f4d3d3b3dede984f2da348ad9208cff0941f2a4fde909f2fe'
+
+
+def match_s1_1(step6_selections):
+    v0 = step6_selections.get('s1_1_req_1')
+    if v0 == '충족':
+        return (0,)
+    else:
+        return ()
+
+
+def match_s2_2(step6_selections):
+    v0 = step6_selections.get('s2_2_req_1')
+    v1 = step6_selections.get('s2_2_req_10')
+    v2 = step6_selections.get('s2_2_req_2')
+    v3 = step6_selections.get('s2_2_req_3')
+    v4 = step6_selections.get('s2_2_req_4')
+    v5 = step6_selections.get('s2_2_req_5')
+    v6 = step6_selections.get('s2_2_req_6')
+    v7 = step6_selections.get('s2_2_req_7')
+    v8 = step6_selections.get('s2_2_req_8')
+    v9 = step6_selections.get('s2_2_req_9')
+    v10 = step6_selections.get('s2_2_sub_2a')
+    v11 = step6_selections.get('s2_2_sub_2b')
+    v12 = step6_selections.get('s2_2_sub_2c')
+    if v9 == '미충족':
+        if v8 == '미충족':
+            if v7 == '미충족':
+                if v6 == '미충족':
+                    if v5 == '미충족':
+                        if v4 == '미충족':
+                            if v3 == '미충족':
+                                if v2 == '미충족':
+                                    if v1 == '미충족':
+                                        if v0 == '미충족':
+                                            if v12 == '변경 있음':
+                                                if v11 == '변경 있음':
+                                                    if v10 == '변경 있음':
+                                                        return (2, 4, 6)
+                                                    else:
+                                                        return (4, 6)
+                                                else:
+                                                    if v10 == '변경 있음':
+                                                        return (2, 6)
+                                                    else:
+                                                        return (6,)
+                                            else:
+                                                if v11 == '변경 있음':
+                                                    if v10 == '변경 있음':
+                                                        return (2, 4)
+                                                    else:
+                                                        return (4,)
+                                                else:
+                                                    if v10 == '변경 있음':
+                                                        return (2,)
+                                                    else:
+                                                        return ()
+                                        else:
+                                            return ()
+                                    elif v1 == '충족':
+                                        if v12 == '변경 있음':
+                                            if v0 == '미충족':
+                                                return (7,)
+                                            else:
+                                                return ()
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    elif v5 == '충족':
+                        if v11 == '변경 있음':
+                            if v4 == '미충족':
+                                if v3 == '충족':
+                                    if v2 == '미충족':
+                                        if v1 == '미충족':
+                                            if v0 == '미충족':
+                                                return (3,)
+                                            else:
+                                                return ()
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        elif v8 == '충족':
+            if v12 == '변경 있음':
+                if v7 == '충족':
+                    if v6 == '충족':
+                        if v5 == '미충족':
+                            if v4 == '미충족':
+                                if v3 == '충족':
+                                    if v2 == '충족':
+                                        if v1 == '미충족':
+                                            if v0 == '충족':
+                                                return (5,)
+                                            else:
+                                                return ()
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    elif v9 == '충족':
+        if v10 == '변경 있음':
+            if v8 == '미충족':
+                if v7 == '미충족':
+                    if v6 == '미충족':
+                        if v5 == '미충족':
+                            if v4 == '충족':
+                                if v3 == '충족':
+                                    if v2 == '미충족':
+                                        if v1 == '미충족':
+                                            if v0 == '미충족':
+                                                return (1,)
+                                            else:
+                                                return ()
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_s2_3(step6_selections):
+    v0 = step6_selections.get('s2_3_req_1')
+    v1 = step6_selections.get('s2_3_req_2')
+    v2 = step6_selections.get('s2_3_req_3')
+    v3 = step6_selections.get('s2_3_req_4')
+    v4 = step6_selections.get('s2_3_req_5')
+    v5 = step6_selections.get('s2_3_req_6')
+    v6 = step6_selections.get('s2_3_req_7')
+    v7 = step6_selections.get('s2_3_req_8')
+    v8 = step6_selections.get('s2_3_req_9')
+    if v8 == '미충족':
+        if v7 == '미충족':
+            if v6 == '미충족':
+                if v5 == '미충족':
+                    if v4 == '미충족':
+                        if v3 == '미충족':
+                            if v2 == '미충족':
+                                if v1 == '미충족':
+                                    if v0 == '미충족':
+                                        return (11,)
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                elif v5 == '충족':
+                    if v4 == '충족':
+                        if v3 == '충족':
+                            if v2 == '충족':
+                                if v1 == '충족':
+                                    if v0 == '충족':
+                                        return (10,)
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        elif v7 == '충족':
+            if v6 == '충족':
+                if v5 == '충족':
+                    if v4 == '충족':
+                        if v3 == '충족':
+                            if v2 == '충족':
+                                if v1 == '충족':
+                                    if v0 == '충족':
+                                        return (8,)
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    elif v8 == '충족':
+        if v7 == '미충족':
+            if v6 == '충족':
+                if v5 == '충족':
+                    if v4 == '충족':
+                        if v3 == '미충족':
+                            if v2 == '충족':
+                                if v1 == '충족':
+                                    if v0 == '충족':
+                                        return (9,)
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_s2_4(step6_selections):
+    v0 = step6_selections.get('s2_4_req_1')
+    v1 = step6_selections.get('s2_4_req_2')
+    v2 = step6_selections.get('s2_4_req_3')
+    v3 = step6_selections.get('s2_4_req_4')
+    v4 = step6_selections.get('s2_4_req_5')
+    v5 = step6_selections.get('s2_4_sub_4a')
+    v6 = step6_selections.get('s2_4_sub_4b')
+    v7 = step6_selections.get('s2_4_sub_4d')
+    v8 = step6_selections.get('s2_4_sub_4e')
+    if v4 == '미충족':
+        if v3 == '미충족':
+            if v2 == '미충족':
+                if v1 == '미충족':
+                    if v0 == '충족':
+                        if v8 == '변경 있음':
+                            if v7 == '변경 있음':
+                                if v6 == '변경 있음':
+                                    return (13, 16, 17)
+                                else:
+                                    return (16, 17)
+                            else:
+                                if v6 == '변경 있음':
+                                    return (13, 17)
+                                else:
+                                    return (17,)
+                        else:
+                            if v7 == '변경 있음':
+                                if v6 == '변경 있음':
+                                    return (13, 16)
+                                else:
+                                    return (16,)
+                            else:
+                                if v6 == '변경 있음':
+                                    return (13,)
+                                else:
+                                    return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            elif v2 == '충족':
+                if v5 == '변경 있음':
+                    if v1 == '충족':
+                        if v0 == '충족':
+                            return (12,)
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    elif v4 == '충족':
+        if v7 == '변경 있음':
+            if v3 == '충족':
+                if v2 == '미충족':
+                    if v1 == '미충족':
+                        if v0 == '충족':
+                            return (15,)
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_s2_5(step6_selections):
+    v0 = step6_selections.get('s2_5_req_1')
+    v1 = step6_selections.get('s2_5_req_2')
+    v2 = step6_selections.get('s2_5_req_3')
+    v3 = step6_selections.get('s2_5_sub_5a')
+    v4 = step6_selections.get('s2_5_sub_5b')
+    v5 = step6_selections.get('s2_5_sub_5c')
+    if v2 == '충족':
+        if v1 == '충족':
+            if v0 == '충족':
+                if v5 == '변경 있음':
+                    if v4 == '변경 있음':
+                        if v3 == '변경 있음':
+                            return (18, 19, 20)
+                        else:
+                            return (19, 20)
+                    else:
+                        if v3 == '변경 있음':
+                            return (18, 20)
+                        else:
+                            return (20,)
+                else:
+                    if v4 == '변경 있음':
+                        if v3 == '변경 있음':
+                            return (18, 19)
+                        else:
+                            return (19,)
+                    else:
+                        if v3 == '변경 있음':
+                            return (18,)
+                        else:
+                            return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_s2_6(step6_selections):
+    v0 = step6_selections.get('s2_6_req_1')
+    v1 = step6_selections.get('s2_6_req_2')
+    v2 = step6_selections.get('s2_6_req_3')
+    v3 = step6_selections.get('s2_6_req_4')
+    v4 = step6_selections.get('s2_6_req_5')
+    v5 = step6_selections.get('s2_6_req_6')
+    v6 = step6_selections.get('s2_6_req_7')
+    v7 = step6_selections.get('s2_6_req_8')
+    v8 = step6_selections.get('s2_6_req_9')
+    v9 = step6_selections.get('s2_6_sub_6a')
+    v10 = step6_selections.get('s2_6_sub_6b')
+    v11 = step6_selections.get('s2_6_sub_6c')
+    v12 = step6_selections.get('s2_6_sub_6d')
+    v13 = step6_selections.get('s2_6_sub_6e')
+    v14 = step6_selections.get('s2_6_sub_6f')
+    v15 = step6_selections.get('s2_6_sub_6g')
+    if v8 == '미충족':
+        if v7 == '미충족':
+            if v6 == '미충족':
+                if v5 == '미충족':
+                    if v4 == '미충족':
+                        if v3 == '미충족':
+                            if v2 == '미충족':
+                                if v1 == '미충족':
+                                    if v0 == '미충족':
+                                        if v15 == '변경 있음':
+                                            if v13 == '변경 있음':
+                                                return (25, 27)
+                                            else:
+                                                return (27,)
+                                        else:
+                                            if v13 == '변경 있음':
+                                                return (25,)
+                                            else:
+                                                return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            elif v2 == '충족':
+                                if v9 == '변경 있음':
+                                    if v1 == '충족':
+                                        if v0 == '충족':
+                                            return (21,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                elif v5 == '충족':
+                    if v10 == '변경 있음':
+                        if v4 == '충족':
+                            if v3 == '충족':
+                                if v2 == '미충족':
+                                    if v1 == '미충족':
+                                        if v0 == '미충족':
+                                            return (22,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            elif v6 == '충족':
+                if v11 == '변경 있음':
+                    if v5 == '충족':
+                        if v4 == '충족':
+                            if v3 == '미충족':
+                                if v2 == '미충족':
+                                    if v1 == '미충족':
+                                        if v0 == '충족':
+                                            return (23,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    elif v8 == '충족':
+        if v7 == '미충족':
+            if v14 == '변경 있음':
+                if v6 == '충족':
+                    if v5 == '충족':
+                        if v4 == '미충족':
+                            if v3 == '미충족':
+                                if v2 == '충족':
+                                    if v1 == '미충족':
+                                        if v0 == '미충족':
+                                            return (26,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        elif v7 == '충족':
+            if v12 == '변경 있음':
+                if v6 == '미충족':
+                    if v5 == '미충족':
+                        if v4 == '미충족':
+                            if v3 == '미충족':
+                                if v2 == '미충족':
+                                    if v1 == '미충족':
+                                        if v0 == '충족':
+                                            return (24,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p1_7(step6_selections):
+    v0 = step6_selections.get('p1_7_req_1')
+    v1 = step6_selections.get('p1_7_req_2')
+    v2 = step6_selections.get('p1_7_req_3')
+    v3 = step6_selections.get('p1_7_req_4')
+    v4 = step6_selections.get('p1_7_req_5')
+    v5 = step6_selections.get('p1_7_sub_7a')
+    v6 = step6_selections.get('p1_7_sub_7b')
+    if v4 == '미충족':
+        if v3 == '충족':
+            if v2 == '미충족':
+                if v5 == '변경 있음':
+                    if v1 == '미충족':
+                        if v0 == '충족':
+                            return (28,)
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            elif v2 == '충족':
+                if v6 == '변경 있음':
+                    if v1 == '충족':
+                        if v0 == '충족':
+                            return (30,)
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    elif v4 == '충족':
+        if v6 == '변경 있음':
+            if v3 == '충족':
+                if v2 == '충족':
+                    if v1 == '충족':
+                        if v0 == '충족':
+                            return (29,)
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p1_8(step6_selections):
+    return (32,)
+
+
+def match_p1_9(step6_selections):
+    v0 = step6_selections.get('p1_9_req_1')
+    v1 = step6_selections.get('p1_9_req_2')
+    v2 = step6_selections.get('p1_9_req_3')
+    v3 = step6_selections.get('p1_9_req_4')
+    v4 = step6_selections.get('p1_9_req_5')
+    v5 = step6_selections.get('p1_9_req_6')
+    v6 = step6_selections.get('p1_9_req_7')
+    v7 = step6_selections.get('p1_9_req_8')
+    v8 = step6_selections.get('p1_9_req_9')
+    if v8 == '충족':
+        if v7 == '미충족':
+            if v6 == '충족':
+                if v5 == '충족':
+                    if v4 == '충족':
+                        if v3 == '충족':
+                            if v2 == '충족':
+                                if v1 == '충족':
+                                    if v0 == '충족':
+                                        return (33,)
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        elif v7 == '충족':
+            if v6 == '미충족':
+                if v5 == '미충족':
+                    if v4 == '미충족':
+                        if v3 == '미충족':
+                            if v2 == '미충족':
+                                if v1 == '미충족':
+                                    if v0 == '미충족':
+                                        return (34,)
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p1_10(step6_selections):
+    v0 = step6_selections.get('p1_10_req_1')
+    v1 = step6_selections.get('p1_10_req_2')
+    v2 = step6_selections.get('p1_10_req_3')
+    v3 = step6_selections.get('p1_10_req_4')
+    v4 = step6_selections.get('p1_10_req_5')
+    v5 = step6_selections.get('p1_10_req_6')
+    v6 = step6_selections.get('p1_10_req_7')
+    v7 = step6_selections.get('p1_10_req_8')
+    v8 = step6_selections.get('p1_10_req_9')
+    v9 = step6_selections.get('p1_10_sub_10a')
+    v10 = step6_selections.get('p1_10_sub_10b')
+    v11 = step6_selections.get('p1_10_sub_10c')
+    if v8 == '충족':
+        if v7 == '충족':
+            if v6 == '미충족':
+                if v5 == '미충족':
+                    if v4 == '미충족':
+                        if v3 == '충족':
+                            if v2 == '충족':
+                                if v1 == '미충족':
+                                    if v9 == '변경 있음':
+                                        if v0 == '충족':
+                                            return (35,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                elif v1 == '충족':
+                                    if v10 == '변경 있음':
+                                        if v0 == '충족':
+                                            return (36,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            elif v6 == '충족':
+                if v11 == '변경 있음':
+                    if v5 == '충족':
+                        if v4 == '충족':
+                            if v3 == '미충족':
+                                if v2 == '충족':
+                                    if v1 == '충족':
+                                        if v0 == '충족':
+                                            return (37,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p3_11(step6_selections):
+    v0 = step6_selections.get('p3_11_req_1')
+    v1 = step6_selections.get('p3_11_req_2')
+    v2 = step6_selections.get('p3_11_req_3')
+    v3 = step6_selections.get('p3_11_sub_11a')
+    v4 = step6_selections.get('p3_11_sub_11b')
+    if v2 == '충족':
+        if v1 == '충족':
+            if v0 == '충족':
+                if v4 == '변경 있음':
+                    if v3 == '변경 있음':
+                        return (38, 39)
+                    else:
+                        return (39,)
+                else:
+                    if v3 == '변경 있음':
+                        return (38,)
+                    else:
+                        return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p3_12(step6_selections):
+    v0 = step6_selections.get('p3_12_req_1')
+    v1 = step6_selections.get('p3_12_req_2')
+    v2 = step6_selections.get('p3_12_req_3')
+    v3 = step6_selections.get('p3_12_req_4')
+    v4 = step6_selections.get('p3_12_req_5')
+    v5 = step6_selections.get('p3_12_sub_12a')
+    if v5 == '변경 있음':
+        if v4 == '미충족':
+            if v3 == '미충족':
+                if v2 == '미충족':
+                    if v1 == '충족':
+                        if v0 == '미충족':
+                            return (40,)
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p3_13(step6_selections):
+    v0 = step6_selections.get('p3_13_req_1')
+    v1 = step6_selections.get('p3_13_req_2')
+    v2 = step6_selections.get('p3_13_req_3')
+    v3 = step6_selections.get('p3_13_req_4')
+    v4 = step6_selections.get('p3_13_req_5')
+    v5 = step6_selections.get('p3_13_req_6')
+    v6 = step6_selections.get('p3_13_sub_13a')
+    v7 = step6_selections.get('p3_13_sub_13b')
+    v8 = step6_selections.get('p3_13_sub_13c')
+    if v5 == '미충족':
+        if v4 == '미충족':
+            if v3 == '충족':
+                if v2 == '충족':
+                    if v1 == '충족':
+                        if v0 == '충족':
+                            if v8 == '변경 있음':
+                                if v6 == '변경 있음':
+                                    return (46, 49)
+                                else:
+                                    return (49,)
+                            else:
+                                if v6 == '변경 있음':
+                                    return (46,)
+                                else:
+                                    return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        elif v4 == '충족':
+            if v7 == '변경 있음':
+                if v3 == '충족':
+                    if v2 == '충족':
+                        if v1 == '충족':
+                            if v0 == '충족':
+                                return (47,)
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    elif v5 == '충족':
+        if v7 == '변경 있음':
+            if v4 == '미충족':
+                if v3 == '충족':
+                    if v2 == '충족':
+                        if v1 == '충족':
+                            if v0 == '충족':
+                                return (48,)
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p3_14(step6_selections):
+    v0 = step6_selections.get('p3_14_req_1')
+    v1 = step6_selections.get('p3_14_req_2')
+    v2 = step6_selections.get('p3_14_req_3')
+    v3 = step6_selections.get('p3_14_req_4')
+    v4 = step6_selections.get('p3_14_req_5')
+    v5 = step6_selections.get('p3_14_req_6')
+    if v5 == '미충족':
+        if v4 == '미충족':
+            if v3 == '충족':
+                if v2 == '충족':
+                    if v1 == '충족':
+                        if v0 == '충족':
+                            return (50,)
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        elif v4 == '충족':
+            if v3 == '충족':
+                if v2 == '충족':
+                    if v1 == '충족':
+                        if v0 == '충족':
+                            return (51,)
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    elif v5 == '충족':
+        if v4 == '미충족':
+            if v3 == '충족':
+                if v2 == '충족':
+                    if v1 == '충족':
+                        if v0 == '충족':
+                            return (52,)
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p3_15(step6_selections):
+    v0 = step6_selections.get('p3_15_req_1')
+    v1 = step6_selections.get('p3_15_req_2')
+    v2 = step6_selections.get('p3_15_req_3')
+    v3 = step6_selections.get('p3_15_req_4')
+    v4 = step6_selections.get('p3_15_req_5')
+    v5 = step6_selections.get('p3_15_req_6')
+    v6 = step6_selections.get('p3_15_req_7')
+    v7 = step6_selections.get('p3_15_req_8')
+    v8 = step6_selections.get('p3_15_req_9')
+    v9 = step6_selections.get('p3_15_sub_15a')
+    v10 = step6_selections.get('p3_15_sub_15b')
+    v11 = step6_selections.get('p3_15_sub_15c')
+    if v8 == '미충족':
+        if v7 == '미충족':
+            if v6 == '미충족':
+                if v11 == '변경 있음':
+                    if v5 == '미충족':
+                        if v4 == '미충족':
+                            if v3 == '미충족':
+                                if v2 == '미충족':
+                                    if v1 == '미충족':
+                                        if v0 == '미충족':
+                                            return (56,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            elif v6 == '충족':
+                if v9 == '변경 있음':
+                    if v5 == '충족':
+                        if v4 == '충족':
+                            if v3 == '충족':
+                                if v2 == '충족':
+                                    if v1 == '충족':
+                                        if v0 == '충족':
+                                            return (53,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        elif v7 == '충족':
+            if v10 == '변경 있음':
+                if v6 == '충족':
+                    if v5 == '충족':
+                        if v4 == '충족':
+                            if v3 == '충족':
+                                if v2 == '충족':
+                                    if v1 == '충족':
+                                        if v0 == '충족':
+                                            return (54,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    elif v8 == '충족':
+        if v10 == '변경 있음':
+            if v7 == '충족':
+                if v6 == '충족':
+                    if v5 == '충족':
+                        if v4 == '충족':
+                            if v3 == '충족':
+                                if v2 == '충족':
+                                    if v1 == '충족':
+                                        if v0 == '충족':
+                                            return (55,)
+                                        else:
+                                            return ()
+                                    else:
+                                        return ()
+                                else:
+                                    return ()
+                            else:
+                                return ()
+                        else:
+                            return ()
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p3_16(step6_selections):
+    v0 = step6_selections.get('p3_16_req_1')
+    v1 = step6_selections.get('p3_16_req_2')
+    v2 = step6_selections.get('p3_16_req_3')
+    v3 = step6_selections.get('p3_16_req_4')
+    v4 = step6_selections.get('p3_16_sub_16a')
+    v5 = step6_selections.get('p3_16_sub_16b')
+    v6 = step6_selections.get('p3_16_sub_16c')
+    v7 = step6_selections.get('p3_16_sub_16d')
+    v8 = step6_selections.get('p3_16_sub_16e')
+    if v3 == '미충족':
+        if v2 == '미충족':
+            if v1 == '충족':
+                if v0 == '미충족':
+                    if v8 == '변경 있음':
+                        if v7 == '변경 있음':
+                            if v5 == '변경 있음':
+                                return (58, 60, 61)
+                            else:
+                                return (60, 61)
+                        else:
+                            if v5 == '변경 있음':
+                                return (58, 61)
+                            else:
+                                return (61,)
+                    else:
+                        if v7 == '변경 있음':
+                            if v5 == '변경 있음':
+                                return (58, 60)
+                            else:
+                                return (60,)
+                        else:
+                            if v5 == '변경 있음':
+                                return (58,)
+                            else:
+                                return ()
+                else:
+                    return ()
+            else:
+                return ()
+        elif v2 == '충족':
+            if v6 == '변경 있음':
+                if v1 == '충족':
+                    if v0 == '미충족':
+                        return (59,)
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    elif v3 == '충족':
+        if v4 == '변경 있음':
+            if v2 == '미충족':
+                if v1 == '충족':
+                    if v0 == '충족':
+                        return (57,)
+                    else:
+                        return ()
+                else:
+                    return ()
+            else:
+                return ()
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p4_17(step6_selections):
+    v0 = step6_selections.get('p4_17_req_1')
+    v1 = step6_selections.get('p4_17_sub_17a')
+    v2 = step6_selections.get('p4_17_sub_17b')
+    if v0 == '미충족':
+        if v2 == '변경 있음':
+            return (63,)
+        else:
+            return ()
+    elif v0 == '충족':
+        if v1 == '변경 있음':
+            return (62,)
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p4_18(step6_selections):
+    v0 = step6_selections.get('p4_18_req_1')
+    if v0 == '충족':
+        return (64,)
+    else:
+        return ()
+
+
+def match_p4_19(step6_selections):
+    v0 = step6_selections.get('p4_19_req_1')
+    if v0 == '충족':
+        return (65,)
+    else:
+        return ()
+
+
+def match_p7_20(step6_selections):
+    v0 = step6_selections.get('p7_20_req_1')
+    if v0 == '충족':
+        return (66, 67)
+    else:
+        return ()
+
+
+def match_p7_21(step6_selections):
+    v0 = step6_selections.get('p7_21_req_1')
+    if v0 == '충족':
+        return (68, 69)
+    else:
+        return ()
+
+
+def match_p7_22(step6_selections):
+    v0 = step6_selections.get('p7_22_req_1')
+    v1 = step6_selections.get('p7_22_req_2')
+    if v1 == '충족':
+        if v0 == '충족':
+            return (70, 71)
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_p7_23(step6_selections):
+    v0 = step6_selections.get('p7_23_req_1')
+    v1 = step6_selections.get('p7_23_req_2')
+    if v1 == '충족':
+        if v0 == '충족':
+            return (72,)
+        else:
+            return ()
+    else:
+        return ()
+
+
+def match_ds_24(step6_selections):
+    v0 = step6_selections.get('ds_24_sub_24a')
+    v1 = step6_selections.get('ds_24_sub_24b')
+    if v1 == '변경 있음':
+        if v0 == '변경 있음':
+            return (73, 74)
+        else:
+            return (74,)
+    else:
+        if v0 == '변경 있음':
+            return (73,)
+        else:
+            return ()
+
+
+MATCHERS = {
+    's1_1': match_s1_1,
+    's2_2': match_s2_2,
+    's2_3': match_s2_3,
+    's2_4': match_s2_4,
+    's2_5': match_s2_5,
+    's2_6': match_s2_6,
+    'p1_7': match_p1_7,
+    'p1_8': match_p1_8,
+    'p1_9': match_p1_9,
+    'p1_10': match_p1_10,
+    'p3_11': match_p3_11,
+    'p3_12': match_p3_12,
+    'p3_13': match_p3_13,
+    'p3_14': match_p3_14,
+    'p3_15': match_p3_15,
+    'p3_16': match_p3_16,
+    'p4_17': match_p4_17,
+    'p4_18': match_p4_18,
+    'p4_19': match_p4_19,
+    'p7_20': match_p7_20,
+    'p7_21': match_p7_21,
+    'p7_22': match_p7_22,
+    'p7_23': match_p7_23,
+    'ds_24': match_ds_24,
+}
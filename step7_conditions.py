@@ -0,0 +1,69 @@
+import ast
+import re
+
+# ===== Step 7 조건식 파서 =====
+# STEP7_ROWS 의 output_condition_all_met / subitem_met / requirements_met /
+# requirements_unmet 값은 아래 형태의 비교식만으로 이루어진다.
+#
+#     step6_selections.get("key") == "value"
+#
+# 비교식은 "and" 또는 줄바꿈으로 이어지며 괄호로 묶일 수 있고,
+# 조건이 없는 행은 "(True)" 로 표기된다.
+# 파싱 결과는 반드시 만족해야 하는 (key, value) 쌍의 frozenset 이다.
+
+_ASSIGN_PREFIX = re.compile(r"^\s*output_if_all_conditions_met\s*=")
+# 엑셀에서 옮기며 생긴 ""key"" 형태의 이중 따옴표
+_DOUBLED_QUOTES = re.compile(r'""([^"\n]+)""')
+# and 없이 줄바꿈으로만 이어진 비교식
+_NEWLINE_CLAUSE = re.compile(r'"\s*\n\s*(?=\(*\s*step6_selections\.get\()')
+
+
+def _normalize(text):
+    expr = _ASSIGN_PREFIX.sub("", text, count=1)
+    expr = _DOUBLED_QUOTES.sub(r'"\1"', expr)
+    expr = _NEWLINE_CLAUSE.sub('" and ', expr)
+    return expr.strip()
+
+
+def _is_str_constant(node):
+    return isinstance(node, ast.Constant) and isinstance(node.value, str)
+
+
+def _collect(node, pairs, text):
+    if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+        for value in node.values:
+            _collect(value, pairs, text)
+        return
+    if isinstance(node, ast.Constant) and node.value is True:
+        return
+    if (
+        isinstance(node, ast.Compare)
+        and len(node.ops) == 1
+        and isinstance(node.ops[0], ast.Eq)
+        and _is_str_constant(node.comparators[0])
+    ):
+        call = node.left
+        if (
+            isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Attribute)
+            and call.func.attr == "get"
+            and isinstance(call.func.value, ast.Name)
+            and call.func.value.id == "step6_selections"
+            and len(call.args) == 1
+            and not call.keywords
+            and _is_str_constant(call.args[0])
+        ):
+            pairs.append((call.args[0].value, node.comparators[0].value))
+            return
+    raise ValueError(f"지원하지 않는 Step 7 조건식입니다: {text!r}")
+
+
+def parse_condition(text):
+    try:
+        tree = ast.parse(_normalize(text), mode="eval")
+    except SyntaxError as exc:
+        raise ValueError(f"Step 7 조건식을 해석할 수 없습니다: {text!r}") from exc
+    pairs = []
+    _collect(tree.body, pairs, text)
+    return frozenset(pairs)
+
@@ -0,0 +1,202 @@
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from step_items import step6_fixed_subitems, step6_items, step6_sync_pairs
+from step7_engine import rule_conditions, step7_table
+
+# ===== Step 7 규칙 커버리지 · 충돌 분석 =====
+# title_key 별 답변 공간(하위항목 "변경 있음/변경 없음", 충족요건 "충족/미충족")을
+# 규칙(큐브 : 키 → 값의 논리곱)에 대해 Shannon 분할로 탐색한다.
+# 전체 조합을 나열하지 않고 분할된 큐브 단위로 다음 세 가지를 보고한다.
+#   uncovered : 어떤 행에도 해당하지 않는 조합 (Step 7 의 "범위에 해당하지 않는" 경고)
+#   conflicts : output_1_tag 가 서로 다른 두 행이 동시에 충족되는 조합
+#   dead_rows : 어떤 조합으로도 충족될 수 없는 행
+#
+#     python step7_coverage.py --workers 4
+
+ANSWER_VALUES = {
+    "sub": {"변경 있음": True, "변경 없음": False},
+    "req": {"충족": True, "미충족": False},
+}
+
+
+def item_variables(title_key):
+    block = step6_items[title_key]
+    return [f"{title_key}_sub_{key}" for key in block.get("subitems", {})] + [
+        f"{title_key}_req_{key}" for key in block.get("requirements", {})
+    ]
+
+
+def domain_constraints(title_key):
+    # fixed   : Step 6 에서 값이 고정되는 키
+    # aliases : 동기화 쌍은 하나의 대표 키로 취급
+    block = step6_items[title_key]
+    fixed = {}
+    aliases = {}
+    for sub_key in block.get("subitems", {}):
+        full_key = f"{title_key}_sub_{sub_key}"
+        if title_key in step6_fixed_subitems:
+            fixed[full_key] = True
+        elif sub_key in step6_sync_pairs:
+            other_key = f"{title_key}_sub_{step6_sync_pairs[sub_key]}"
+            aliases[full_key] = min(full_key, other_key)
+    return fixed, aliases
+
+
+def rule_cube(required, title_key, fixed, aliases):
+    # 규칙을 대표 키 기준 큐브로 변환, 충족될 수 없으면 (None, 사유) 반환
+    prefix = f"{title_key}_"
+    variables = set(item_variables(title_key))
+    cube = {}
+    for key, value in sorted(required):
+        if not key.startswith(prefix) or key not in variables:
+            return None, f"Step 6 에 없는 키 {key}"
+        kind = key[len(prefix):].split("_", 1)[0]
+        if value not in ANSWER_VALUES[kind]:
+            return None, f"{key} 에 허용되지 않는 값 {value!r}"
+        wanted = ANSWER_VALUES[kind][value]
+        if key in fixed and fixed[key] != wanted:
+            return None, f"{key} 는 항상 변경 있음으로 고정됩니다"
+        if key in fixed:
+            continue
+        var = aliases.get(key, key)
+        if cube.get(var, wanted) != wanted:
+            return None, f"{key} 에 서로 다른 값이 요구됩니다"
+        cube[var] = wanted
+    return cube, None
+
+
+def uncovered_cubes(cubes, assignment=None):
+    # 현재 분기와 양립하는 큐브가 없으면 분기 전체가 미해당, 빈 큐브가 있으면 전체가 해당
+    if assignment is None:
+        assignment = {}
+    if not cubes:
+        return [dict(assignment)]
+    if any(not cube for cube in cubes):
+        return []
+    counts = {}
+    for cube in cubes:
+        for var in cube:
+            counts[var] = counts.get(var, 0) + 1
+    var = max(counts, key=counts.get)
+    uncovered = []
+    for value in (True, False):
+        branch = [
+            {k: v for k, v in cube.items() if k != var}
+            for cube in cubes
+            if cube.get(var, value) == value
+        ]
+        assignment[var] = value
+        uncovered.extend(uncovered_cubes(branch, assignment))
+        del assignment[var]
+    return uncovered
+
+
+def merge_cubes(first, second):
+    merged = dict(first)
+    for var, value in second.items():
+        if merged.get(var, value) != value:
+            return None
+        merged[var] = value
+    return merged
+
+
+def _describe(cube, title_key):
+    values = {}
+    for var, wanted in cube.items():
+        kind = var[len(title_key) + 1:].split("_", 1)[0]
+        values[var] = next(k for k, v in ANSWER_VALUES[kind].items() if v == wanted)
+    return values
+
+
+def analyze_title_key(title_key):
+    fixed, aliases = domain_constraints(title_key)
+    free_vars = {aliases.get(key, key) for key in item_variables(title_key)} - set(fixed)
+    table = step7_table()
+    conditions = rule_conditions()
+
+    live = []
+    dead_rows = []
+    for position, row in enumerate(table):
+        if row["title_key"] != title_key:
+            continue
+        cube, reason = rule_cube(conditions[position], title_key, fixed, aliases)
+        if cube is None:
+            dead_rows.append({"row": position, "reason": reason})
+        else:
+            live.append((position, cube))
+
+    uncovered = uncovered_cubes([cube for _, cube in live])
+    conflicts = []
+    for i, (first_position, first_cube) in enumerate(live):
+        for second_position, second_cube in live[i + 1:]:
+            first_tag = table[first_position]["output_1_tag"]
+            second_tag = table[second_position]["output_1_tag"]
+            if first_tag == second_tag:
+                continue
+            overlap = merge_cubes(first_cube, second_cube)
+            if overlap is not None:
+                conflicts.append({
+                    "rows": [first_position, second_position],
+                    "tags": [first_tag, second_tag],
+                    "combinations": 2 ** (len(free_vars) - len(overlap)),
+                    "when": _describe(overlap, title_key),
+                })
+
+    return {
+        "title_key": title_key,
+        "combinations": 2 ** len(free_vars),
+        "uncovered_combinations": sum(2 ** (len(free_vars) - len(cube)) for cube in uncovered),
+        "uncovered": [_describe(cube, title_key) for cube in uncovered],
+        "conflicts": conflicts,
+        "dead_rows": dead_rows,
+    }
+
+
+def analyze(workers=1):
+    title_keys = list(step6_items)
+    if workers <= 1:
+        reports = [analyze_title_key(title_key) for title_key in title_keys]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            reports = list(pool.map(analyze_title_key, title_keys))
+    return {"items": reports}
+
+
+def format_report(report):
+    lines = []
+    for item in report["items"]:
+        lines.append(
+            f"[{item['title_key']}] 조합 {item['combinations']}개 중 미해당 "
+            f"{item['uncovered_combinations']}개, 충돌 {len(item['conflicts'])}건, "
+            f"충족 불가 행 {len(item['dead_rows'])}개"
+        )
+        for conflict in item["conflicts"]:
+            lines.append(
+                f"    충돌 : 행 {conflict['rows'][0]}({conflict['tags'][0][:10]!r}) ↔ "
+                f"행 {conflict['rows'][1]}({conflict['tags'][1][:10]!r}), "
+                f"{conflict['combinations']}개 조합"
+            )
+        for dead in item["dead_rows"]:
+            lines.append(f"    충족 불가 : 행 {dead['row']} - {dead['reason']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Step 6 답변 조합 전체에 대한 STEP7_ROWS 커버리지와 충돌을 분석합니다."
+    )
+    parser.add_argument("--workers", type=int, default=1, help="title_key 병렬 분석 프로세스 수")
+    parser.add_argument("--json", action="store_true", help="미해당 조합을 포함한 전체 결과를 JSON 으로 출력")
+    args = parser.parse_args(argv)
+
+    report = analyze(args.workers)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import re
+
+# ===== 필요서류 목록 구조화 =====
+# output_2_text 의 번호 목록("1. (S.2.1) 제조소명…")을 (번호, CTD 항목, 문구) 로 나누고,
+# 행마다 반복되는 같은 서류는 하나의 문서 id 로 묶는다.
+#   documents     : 문서 id → (CTD 항목, 문구)   — CTD 항목이 없으면 ""
+#   row_documents : 행 id → ((번호, 문서 id), …) — 원문 목록 순서
+# 번호 없이 이어지는 줄("• …")은 바로 앞 서류 문구에 줄바꿈으로 붙인다.
+# output_1_text 는 보고유형 안내문이며 번호 목록이 없으므로 대상이 아니다.
+
+_SECTION = r"[SPAR](?:\.\d+)*"
+_ENTRY = re.compile(
+    rf"(?P<number>\d+)\.\s*(?:\((?P<section>{_SECTION}(?:(?:/| 또는 ){_SECTION})*)\)\s*)?(?P<text>.*)"
+)
+
+
+def parse_document_list(text):
+    # [(번호, CTD 항목, 문구)] — 첫 번호 줄 이전(머리말)은 건너뛴다
+    entries = []
+    for line in text.split("\n"):
+        match = _ENTRY.fullmatch(line.strip())
+        if match is not None:
+            entries.append([int(match["number"]), match["section"] or "", match["text"].strip()])
+        elif line.strip() and entries:
+            entries[-1][2] += "\n" + line.strip()
+    return [tuple(entry) for entry in entries]
+
+
+def build_document_catalog(table):
+    documents = {}
+    row_documents = []
+    for row in table:
+        refs = []
+        for number, section, text in parse_document_list(row["output_2_text"]):
+            refs.append((number, documents.setdefault((section, text), len(documents))))
+        row_documents.append(tuple(refs))
+    return tuple(documents), tuple(row_documents)
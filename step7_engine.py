@@ -0,0 +1,252 @@
+from collections.abc import Mapping
+from functools import cache, lru_cache
+from types import MappingProxyType
+
+from step6_answers import ANSWER_CODE_OF, ANSWER_CODES, Step6Answers, step6_key_index
+from step7_artifact import load_artifact
+from step7_bitset import compile_mask, encode_selections, mask_met
+from step7_conditions import parse_condition
+
+try:
+    import step7_compiled
+except ImportError:
+    step7_compiled = None
+
+# ===== Step 7 판정 엔진 (Streamlit 비의존) =====
+# 앱, 일괄 처리, CLI 가 모두 공유하는 판정 로직.
+# 규칙 컴파일은 첫 호출 시 프로세스당 1회만 수행된다.
+
+RESULT_FIELDS = ("output_1_tag", "output_1_text", "output_2_text")
+
+# (title_key, 지문) → 판정 결과 LRU 캐시 크기 (프로세스 전체 공유)
+RESULT_CACHE_SIZE = 4096
+
+
+# 열 밀림을 바로잡고 검증한 읽기 전용 규칙 표 (판정 경로는 이 표만 사용)
+# 정규화와 검증은 아티팩트 생성 시 끝나므로 여기서는 읽기만 한다.
+@cache
+def step7_table():
+    rules = load_artifact("rules")
+    columns = rules["columns"]
+    return tuple(MappingProxyType(dict(zip(columns, values))) for values in rules["table"])
+
+
+# 규칙 표 내용의 해시 : 생성 모듈(step7_compiled.py)이 최신인지 확인하는 데 사용
+def table_digest():
+    return load_artifact("rules")["digest"]
+
+
+# step6_selections 키 → title_key (Step 6 의 답변 변경이 어느 Step 7 항목을 무효화하는지)
+def step6_key_title_keys():
+    return load_artifact("rules")["step6_key_title_keys"]
+
+
+@cache
+def rule_conditions():
+    return tuple(parse_condition(row["output_condition_all_met"]) for row in step7_table())
+
+
+# title_key → ((STEP7_ROWS 위치, (care_mask, expected_bits)), ...)
+@cache
+def compile_rules():
+    key_index = step6_key_index()
+    rules = {}
+    for position, (row, required) in enumerate(zip(step7_table(), rule_conditions())):
+        rules.setdefault(row["title_key"], []).append(
+            (position, compile_mask(required, key_index))
+        )
+    return {title_key: tuple(entries) for title_key, entries in rules.items()}
+
+
+# 출력 문구는 중복을 제거한 공유 텍스트 표에 한 번만 보관하고
+# 각 행(행 id = STEP7_ROWS 위치)은 표의 인덱스로 참조한다.
+@cache
+def text_table():
+    texts = {}
+    for row in step7_table():
+        for field in RESULT_FIELDS:
+            texts.setdefault(row[field], len(texts))
+    return tuple(texts)
+
+
+@cache
+def row_text_ids():
+    index = {text: text_id for text_id, text in enumerate(text_table())}
+    return tuple(tuple(index[row[field]] for field in RESULT_FIELDS) for row in step7_table())
+
+
+@cache
+def row_results():
+    table = text_table()
+    return tuple(tuple(table[text_id] for text_id in ids) for ids in row_text_ids())
+
+
+def row_result(row_id):
+    return row_results()[row_id]
+
+
+# 필요서류 카탈로그 (step7_documents) : 문서 id → (CTD 항목, 문구)
+@cache
+def document_catalog():
+    return tuple(tuple(entry) for entry in load_artifact("rules")["documents"])
+
+
+# 행 id → ((번호, 문서 id), …)
+@cache
+def row_documents():
+    return tuple(
+        tuple(tuple(ref) for ref in refs) for refs in load_artifact("rules")["row_documents"]
+    )
+
+
+def encode(step6_selections):
+    if isinstance(step6_selections, Step6Answers):
+        return step6_selections.vector()
+    return encode_selections(step6_selections, step6_key_index())
+
+
+def match_title_key(title_key, step6_vector):
+    return [
+        position
+        for position, mask in compile_rules().get(title_key, ())
+        if mask_met(step6_vector, mask)
+    ]
+
+
+# title_key → 해당 행들의 조건식이 참조하는 step6_selections 키
+@cache
+def relevant_keys():
+    keys = {}
+    for row, required in zip(step7_table(), rule_conditions()):
+        keys.setdefault(row["title_key"], set()).update(key for key, _ in required)
+    return {title_key: tuple(sorted(item_keys)) for title_key, item_keys in keys.items()}
+
+
+# title_key → (참조 키 중 레지스트리에 있는 키, 그 레지스트리 위치)
+# 레지스트리 밖의 키를 요구하는 행은 충족될 수 없으므로 지문에서 제외한다.
+@cache
+def fingerprint_keys():
+    key_index = step6_key_index()
+    registry = {}
+    for title_key, keys in relevant_keys().items():
+        known = tuple(key for key in keys if key in key_index)
+        registry[title_key] = (known, tuple(key_index[key] for key in known))
+    return registry
+
+
+# 참조 키의 답변 코드(step6_answers.ANSWER_CODES, 0 = 미응답 · 알 수 없는 값)를 나열한 bytes
+def fingerprint(title_key, step6_selections):
+    keys, positions = fingerprint_keys().get(title_key, ((), ()))
+    if isinstance(step6_selections, Step6Answers):
+        return step6_selections.codes_at(positions)
+    return bytes(ANSWER_CODE_OF.get(step6_selections.get(key), 0) for key in keys)
+
+
+# 생성 모듈이 현재 규칙 표로 만들어진 경우에만 사용하고, 아니면 비트마스크 판정으로 대체
+@cache
+def compiled_matchers():
+    if step7_compiled is not None and step7_compiled.TABLE_DIGEST == table_digest():
+        return step7_compiled.MATCHERS
+    return {}
+
+
+@lru_cache(maxsize=RESULT_CACHE_SIZE)
+def _match_fingerprint(title_key, codes):
+    keys, _ = fingerprint_keys().get(title_key, ((), ()))
+    selections = {key: ANSWER_CODES[code] for key, code in zip(keys, codes) if code}
+    matcher = compiled_matchers().get(title_key)
+    if matcher is not None:
+        return matcher(selections)
+    return tuple(match_title_key(title_key, encode(selections)))
+
+
+def result_cache_info():
+    return _match_fingerprint.cache_info()
+
+
+def evaluate_title_key_rows(title_key, step6_selections):
+    # 참조 키의 값이 같은 답변은 세션과 무관하게 같은 행 id 튜플을 공유
+    return _match_fingerprint(title_key, fingerprint(title_key, step6_selections))
+
+
+def evaluate_title_key(title_key, step6_selections):
+    return [row_result(row_id) for row_id in evaluate_title_key_rows(title_key, step6_selections)]
+
+
+# 외부 입력(CLI · HTTP 서비스 · 일괄 양식)의 답변 세트 검증 — 잘못된 입력을 빈 결과(범위 외)로 판정하지 않도록
+# TypeError : step6_targets 가 배열이 아니거나 step6_selections 가 객체가 아님
+# KeyError  : step6_items 에 없는 title_key
+def check_request(step6_selections, step6_targets):
+    if not isinstance(step6_targets, list) or not isinstance(step6_selections, Mapping):
+        raise TypeError("step6_targets 는 배열, step6_selections 는 객체여야 합니다")
+    step6_items = load_artifact("catalog")["step6_items"]
+    unknown = [
+        title_key
+        for title_key in step6_targets
+        if not isinstance(title_key, str) or title_key not in step6_items
+    ]
+    if unknown:
+        raise KeyError(f"알 수 없는 title_key : {unknown}")
+
+
+def evaluate(step6_selections, step6_targets=None):
+    # step7_results 와 같은 구조 : {title_key: [(output_1_tag, output_1_text, output_2_text), …]}
+    if step6_targets is None:
+        step6_targets = list(load_artifact("catalog")["step6_items"])
+    check_request(step6_selections, step6_targets)
+    return {
+        title_key: evaluate_title_key(title_key, step6_selections)
+        for title_key in step6_targets
+    }
+
+
+class Step7Results(Mapping):
+    # st.session_state.step7_results 값 : title_key 별 행 id 만 보관하고
+    # 조회 시 문서화된 [(output_1_tag, output_1_text, output_2_text), …] 구조로 복원
+    # Step 6 답변이 바뀐 title_key 는 dirty 로 표시되어 다음 조회 전에 다시 판정된다.
+    __slots__ = ("_rows", "_dirty")
+
+    def __init__(self, rows=None):
+        self._rows = {title_key: tuple(row_ids) for title_key, row_ids in (rows or {}).items()}
+        self._dirty = set()
+
+    def __getitem__(self, title_key):
+        return [row_result(row_id) for row_id in self._rows[title_key]]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __repr__(self):
+        return f"Step7Results({self._rows!r})"
+
+    def row_ids(self, title_key):
+        return self._rows[title_key]
+
+    def set_rows(self, title_key, row_ids):
+        self._rows[title_key] = tuple(row_ids)
+        self._dirty.discard(title_key)
+
+    def refresh(self, title_keys, step6_selections):
+        # dirty 이거나 아직 판정하지 않은 title_key 를 한 번에 판정하여 결과를 완성
+        for title_key in title_keys:
+            if self.is_dirty(title_key):
+                self.set_rows(title_key, evaluate_title_key_rows(title_key, step6_selections))
+
+    def mark_dirty(self, title_keys):
+        self._dirty.update(title_keys)
+
+    def is_dirty(self, title_key):
+        return title_key in self._dirty or title_key not in self._rows
+
+    def retain(self, title_keys):
+        # title_keys 에 없는 항목의 결과를 제거
+        for title_key in self._rows.keys() - set(title_keys):
+            del self._rows[title_key]
+        self._dirty &= set(title_keys)
+
+    def clear(self):
+        self._rows.clear()
+        self._dirty.clear()
@@ -0,0 +1,141 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from step7_artifact import load_artifact
+
+# ===== Step 7 판정 서비스 부하 시험 =====
+# 로컬 step7_server.py 에 keep-alive 연결 여러 개로 POST /evaluate 를 일정한 속도로 보내고
+# 처리량과 지연 시간 분포(p50/p95/p99/최대)를 출력한다.
+# 답변 세트는 --answers JSONL(step7_cli.py 입력과 같은 형식) 또는 Step 6 항목에서 무작위로 만든다.
+#
+#     python step7_server.py --workers 4 &
+#     python step7_loadtest.py --rate 500 --duration 10 --connections 16
+
+ANSWER_CHOICES = {"subitems": ("변경 있음", "변경 없음"), "requirements": ("충족", "미충족")}
+KIND_INFIX = {"subitems": "sub", "requirements": "req"}
+
+
+def random_answer_sets(count, targets_per_set, seed):
+    step6_items = load_artifact("catalog")["step6_items"]
+    title_keys = list(step6_items)
+    rng = random.Random(seed)
+    answer_sets = []
+    for _ in range(count):
+        step6_targets = rng.sample(title_keys, min(targets_per_set, len(title_keys)))
+        step6_selections = {}
+        for title_key in step6_targets:
+            for kind, choices in ANSWER_CHOICES.items():
+                for item_key in step6_items[title_key].get(kind, {}):
+                    step6_selections[f"{title_key}_{KIND_INFIX[kind]}_{item_key}"] = rng.choice(choices)
+        answer_sets.append({"step6_targets": step6_targets, "step6_selections": step6_selections})
+    return answer_sets
+
+
+def load_answer_sets(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def build_request(host, port, record):
+    body = json.dumps(record, ensure_ascii=False).encode("utf-8")
+    head = (
+        "POST /evaluate HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "\r\n"
+    )
+    return head.encode("ascii") + body
+
+
+async def _read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def _connection(host, port, requests, schedule, latencies, failures):
+    # schedule : 요청별 예정 전송 시각(개방 루프) — 늦어진 요청도 예정 시각부터 지연을 잰다
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for request, due in zip(requests, schedule):
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            writer.write(request)
+            await writer.drain()
+            status = await _read_response(reader)
+            latencies.append(time.perf_counter() - due)
+            if status != 200:
+                failures.append(status)
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run(host, port, answer_sets, rate, duration, connections):
+    total = int(rate * duration)
+    requests = [build_request(host, port, answer_sets[i % len(answer_sets)]) for i in range(total)]
+    started = time.perf_counter() + 0.2
+    schedule = [started + i / rate for i in range(total)]
+
+    latencies = []
+    failures = []
+    await asyncio.gather(*(
+        _connection(host, port, requests[c::connections], schedule[c::connections], latencies, failures)
+        for c in range(connections)
+    ))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "failures": len(failures),
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            name: round(percentile(latencies, fraction) * 1000, 3)
+            for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99), ("max", 1.0))
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 Step 7 판정 서비스에 부하를 주고 지연 시간을 측정합니다.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8507)
+    parser.add_argument("--rate", type=float, default=300, help="초당 요청 수 (전체)")
+    parser.add_argument("--duration", type=float, default=10, help="시험 시간(초)")
+    parser.add_argument("--connections", type=int, default=16, help="keep-alive 연결 수")
+    parser.add_argument("--answers", help="답변 세트 JSONL (없으면 무작위 생성)")
+    parser.add_argument("--sets", type=int, default=1000, help="무작위 답변 세트 수")
+    parser.add_argument("--targets", type=int, default=10, help="답변 세트당 step6_targets 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.answers:
+        answer_sets = load_answer_sets(args.answers)
+    else:
+        answer_sets = random_answer_sets(args.sets, args.targets, args.seed)
+    report = asyncio.run(
+        run(args.host, args.port, answer_sets, args.rate, args.duration, args.connections)
+    )
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import re
+from types import MappingProxyType
+
+from step_items import step6_items
+from step7_conditions import parse_condition
+
+# ===== STEP7_ROWS 정규화 (로드 시 1회) =====
+# 엑셀에서 옮기는 과정에서 빈 셀이 빠져 열이 앞으로 밀린 행을
+# "subitem and requirements steat" 값과 보고유형 태그(AR/IR/Cmin/Cmaj)를 기준으로 재정렬하고,
+# title_key 를 step6_items 키로 복원한 뒤 읽기 전용 행으로 고정한다.
+
+COLUMNS = (
+    "step",
+    "heading_text",
+    "title_key",
+    "title_text",
+    "subitem and requirements steat",
+    "output_condition_all_met",
+    "subitem_met",
+    "requirements_met",
+    "requirements_unmet",
+    "output_1_tag",
+    "output_1_text",
+    "output_2_text",
+)
+
+CONDITION_COLUMNS = ("subitem_met", "requirements_met", "requirements_unmet")
+
+REPORT_TAGS = ("AR", "IR", "Cmin", "Cmaj")
+
+_STEAT = re.compile(
+    r'\(subitem_met ([!=])= ""\) and '
+    r'\(requirements_met ([!=])= ""\) and '
+    r'\(requirements_unmet ([!=])= ""\)'
+)
+
+
+def _title_key_for(text):
+    # 제목 전체가 같거나, 마지막 줄(번호가 붙은 항목명)이 같은 step6_items 키
+    if text in step6_items:
+        return text
+    for title_key, block in step6_items.items():
+        if block["title"] == text:
+            return title_key
+    last_line = text.strip().splitlines()[-1] if text.strip() else ""
+    for title_key, block in step6_items.items():
+        if block["title"].splitlines()[-1] == last_line:
+            return title_key
+    return None
+
+
+def _is_aligned(row):
+    return (
+        _STEAT.fullmatch(row["subitem and requirements steat"]) is not None
+        and row["output_1_tag"] in REPORT_TAGS
+        and row["title_key"] in step6_items
+    )
+
+
+def _realign(row, position):
+    values = [row[column] for column in COLUMNS if row[column] != ""]
+    steat_at = next(
+        (index for index, value in enumerate(values) if _STEAT.fullmatch(value)), None
+    )
+    if steat_at is None:
+        raise ValueError(f"STEP7_ROWS[{position}] 에서 조건 상태 열을 찾을 수 없습니다")
+
+    realigned = dict.fromkeys(COLUMNS, "")
+    realigned["step"] = values[0]
+    # 제목으로 확인되지 않는 값은 heading_text → title_text 순서로 빈 열에만 채운다
+    for value in values[1:steat_at]:
+        title_key = _title_key_for(value)
+        if value in step6_items and not realigned["title_key"]:
+            realigned["title_key"] = value
+        elif title_key is not None and not realigned["title_text"]:
+            realigned["title_text"] = value
+            realigned["title_key"] = realigned["title_key"] or title_key
+        elif not realigned["heading_text"]:
+            realigned["heading_text"] = value
+        elif not realigned["title_text"]:
+            realigned["title_text"] = value
+        else:
+            raise ValueError(f"STEP7_ROWS[{position}] 의 제목 열에 넣을 수 없는 값이 있습니다: {value!r}")
+
+    steat = values[steat_at]
+    filled = [
+        column
+        for column, op in zip(CONDITION_COLUMNS, _STEAT.fullmatch(steat).groups())
+        if op == "!"
+    ]
+    tail = values[steat_at + 1:]
+    if len(tail) < 2 + len(filled):
+        raise ValueError(f"STEP7_ROWS[{position}] 의 조건 또는 출력 열이 부족합니다")
+    realigned["subitem and requirements steat"] = steat
+    realigned["output_condition_all_met"] = tail[0]
+    for column, value in zip(filled, tail[1:]):
+        realigned[column] = value
+    outputs = tail[1 + len(filled):]
+    for column, value in zip(("output_1_tag", "output_1_text", "output_2_text"), outputs):
+        realigned[column] = value
+    return realigned
+
+
+def _validate(row, source, position):
+    if source["title_text"] and not row["title_text"]:
+        raise ValueError(f"STEP7_ROWS[{position}] 의 title_text 가 정규화 중에 사라졌습니다")
+    if row["title_key"] not in step6_items:
+        raise ValueError(f"STEP7_ROWS[{position}] 의 title_key {row['title_key']!r} 가 step6_items 에 없습니다")
+    if row["output_1_tag"] not in REPORT_TAGS:
+        raise ValueError(f"STEP7_ROWS[{position}] 의 output_1_tag {row['output_1_tag']!r} 가 보고유형이 아닙니다")
+    required = parse_condition(row["output_condition_all_met"])
+    listed = frozenset().union(
+        *(parse_condition(row[column]) for column in CONDITION_COLUMNS if row[column])
+    )
+    if listed != required:
+        raise ValueError(f"STEP7_ROWS[{position}] 의 조건 열이 output_condition_all_met 와 다릅니다")
+
+
+def normalize_rows(rows):
+    table = []
+    for position, row in enumerate(rows):
+        normalized = dict(row) if _is_aligned(row) else _realign(row, position)
+        _validate(normalized, row, position)
+        table.append(MappingProxyType(normalized))
+    return tuple(table)
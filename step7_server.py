@@ -0,0 +1,236 @@
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from step7_engine import check_request, evaluate_title_key_rows, row_result
+
+# ===== Step 7 판정 HTTP 서비스 (표준 라이브러리 asyncio) =====
+# 변경관리 시스템 등 다른 도구가 Streamlit 화면 없이 Step 7 판정을 요청할 수 있도록 한다.
+#   POST /evaluate        {"step6_targets": [...], "step6_selections": {...}}
+#                         → {"step7_results": {title_key: [[output_1_tag, output_1_text, output_2_text], …]}}
+#   POST /evaluate/batch  [{...}, {...}, …] → [{"step7_results": …} 또는 {"error": …}, …] (입력 순서)
+# 판정은 크기가 제한된 작업자 풀에서 공유 판정 엔진(생성 모듈 + 지문 LRU 캐시)으로 수행하며,
+# 같은 판정 결과의 응답 JSON 은 한 번만 직렬화한다. HTTP/1.1 keep-alive 를 지원한다.
+#
+#     python step7_server.py --port 8507 --workers 4
+
+MAX_BODY = 8 * 1024 * 1024
+MAX_BATCH = 10_000
+KEEP_ALIVE_TIMEOUT = 30
+
+# 이 크기 이하의 단건 요청은 작업자 풀을 거치지 않고 바로 판정
+INLINE_BODY = 64 * 1024
+
+# 판정 결과 키 → 응답 JSON 조각 LRU 캐시 크기
+RESPONSE_CACHE_SIZE = 4096
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+}
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def results_key(record):
+    # (title_key, 행 id 튜플) — 참조 키 지문이 같은 답변은 같은 키가 된다
+    if not isinstance(record, dict):
+        raise ValueError("요청 본문은 JSON 객체여야 합니다")
+    step6_targets = record["step6_targets"]
+    step6_selections = record["step6_selections"]
+    check_request(step6_selections, step6_targets)
+    return tuple(
+        (title_key, evaluate_title_key_rows(title_key, step6_selections))
+        for title_key in step6_targets
+    )
+
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def results_json(key):
+    results = {
+        title_key: [row_result(row_id) for row_id in row_ids]
+        for title_key, row_ids in key
+    }
+    return json.dumps({"step7_results": results}, ensure_ascii=False)
+
+
+def evaluate_record(record):
+    try:
+        return results_json(results_key(record))
+    except (ValueError, KeyError, TypeError, AttributeError) as exc:
+        return json.dumps({"error": f"{type(exc).__name__}: {exc}"}, ensure_ascii=False)
+
+
+def evaluate_body(path, body):
+    try:
+        payload = json.loads(body)
+    except (ValueError, RecursionError) as exc:
+        # RecursionError : 지나치게 깊게 중첩된 배열 · 객체
+        raise RequestError(400, f"JSON 을 해석할 수 없습니다: {exc}") from None
+    if path == "/evaluate":
+        try:
+            return results_json(results_key(payload))
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            raise RequestError(400, f"{type(exc).__name__}: {exc}") from None
+    if not isinstance(payload, list):
+        raise RequestError(400, "/evaluate/batch 본문은 JSON 배열이어야 합니다")
+    if len(payload) > MAX_BATCH:
+        raise RequestError(413, f"한 번에 {MAX_BATCH}건까지 판정할 수 있습니다")
+    return "[" + ",".join(evaluate_record(record) for record in payload) + "]"
+
+
+def _response(status, body, keep_alive):
+    data = body.encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(data)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("ascii") + data
+
+
+def _error_body(message):
+    return json.dumps({"error": message}, ensure_ascii=False)
+
+
+async def _read_request(reader):
+    # (메서드, 경로, HTTP 버전, 헤더, 본문) — 연결이 정상적으로 닫히면 None
+    try:
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+    except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+        return None
+    except asyncio.LimitOverrunError:
+        raise RequestError(413, "요청 헤더가 너무 큽니다") from None
+
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = request_line.split(" ")
+    except ValueError:
+        raise RequestError(400, "요청 줄이 올바르지 않습니다") from None
+    headers = {}
+    for line in header_lines:
+        if line:
+            name, _, value = line.partition(":")
+            name = name.strip().lower()
+            if name == "content-length" and name in headers:
+                raise RequestError(400, "Content-Length 가 여러 번 지정되었습니다")
+            headers[name] = value.strip()
+
+    # 청크 전송 등은 지원하지 않는다 : 본문 경계를 알 수 없으므로 거부하고 연결을 닫는다
+    # (남은 바이트를 다음 요청으로 해석하면 프록시 뒤에서 요청 밀반입이 가능해진다)
+    if "transfer-encoding" in headers:
+        raise RequestError(501, "Transfer-Encoding 은 지원하지 않습니다. Content-Length 로 보내 주세요")
+    # 본문 경계 오류(RequestError)는 모두 handle 에서 응답 후 연결을 닫는다
+    content_length = headers.get("content-length", "0")
+    if not (content_length.isascii() and content_length.isdigit()):
+        raise RequestError(400, "Content-Length 가 올바르지 않습니다")
+    length = int(content_length)
+    if length > MAX_BODY:
+        raise RequestError(413, f"본문은 {MAX_BODY} 바이트까지 허용됩니다")
+    body = await reader.readexactly(length) if length else b""
+    return method, target.split("?", 1)[0], version, headers, body
+
+
+def _wants_keep_alive(version, headers):
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+class Step7Service:
+    def __init__(self, workers=4):
+        # 작업자 수만큼만 동시에 판정하고 나머지 요청은 이벤트 루프에서 대기
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="step7")
+        self.slots = asyncio.Semaphore(workers)
+
+    async def evaluate(self, path, body):
+        # 단건 판정은 캐시 적중 시 수십 µs 이므로 이벤트 루프에서 바로 처리한다.
+        # 스레드로 넘기면 GIL 전환 간격(5ms) 만큼 꼬리 지연이 늘어난다.
+        if path == "/evaluate" and len(body) <= INLINE_BODY:
+            return evaluate_body(path, body)
+        async with self.slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.pool, evaluate_body, path, body)
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except RequestError as exc:
+                    writer.write(_response(exc.status, _error_body(str(exc)), False))
+                    break
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if request is None:
+                    break
+
+                method, path, version, headers, body = request
+                keep_alive = _wants_keep_alive(version, headers)
+                if path not in ("/evaluate", "/evaluate/batch"):
+                    status, payload = 404, _error_body(f"알 수 없는 경로입니다: {path}")
+                elif method != "POST":
+                    status, payload = 405, _error_body("POST 요청만 허용됩니다")
+                else:
+                    try:
+                        status, payload = 200, await self.evaluate(path, body)
+                    except RequestError as exc:
+                        status, payload = exc.status, _error_body(str(exc))
+                    except Exception as exc:
+                        # 예상하지 못한 판정 오류도 연결을 끊지 않고 500 으로 응답
+                        status, payload = 500, _error_body(f"{type(exc).__name__}: {exc}")
+
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def serve(host, port, workers):
+    service = Step7Service(workers)
+    # 규칙 표 · 생성 모듈을 첫 요청 전에 불러 둔다
+    evaluate_body("/evaluate", '{"step6_targets": [], "step6_selections": {}}')
+    server = await asyncio.start_server(service.handle, host, port, limit=64 * 1024)
+    try:
+        async with server:
+            print(f"Step 7 판정 서비스 : http://{host}:{port}/evaluate (작업자 {workers}개)", flush=True)
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Step 7 판정 HTTP 서비스를 실행합니다.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8507)
+    parser.add_argument("--workers", type=int, default=4, help="동시에 판정할 작업자 수")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import re
+from functools import cache
+
+from step7_engine import document_catalog, row_documents, step7_table
+
+# ===== 필요서류 통합 목록 =====
+# 여러 title_key 의 판정 결과(행 id)를 하나로 합쳐 중복 없는 필요서류 목록을 CTD 항목별로 묶고,
+# 가장 엄격한 보고유형(Cmaj > Cmin > IR > AR)을 구한다.
+# 행마다 미리 계산된 문서 id 만 사용하므로 해당 행 수에 비례하는 시간에 끝난다.
+
+# 엄격한 순서 (뒤로 갈수록 엄격)
+REPORT_TAG_ORDER = ("AR", "IR", "Cmin", "Cmaj")
+
+# CTD 항목 정렬 순서 : 원료의약품(S) → 완제의약품(P) → 부록(A) → 지역정보(R), CTD 항목이 없는 서류는 마지막
+_SECTION_PARTS = {"S": 0, "P": 1, "A": 2, "R": 3}
+_SECTION_NUMBERS = re.compile(r"\d+")
+
+
+@cache
+def row_tag_ranks():
+    return tuple(REPORT_TAG_ORDER.index(row["output_1_tag"]) for row in step7_table())
+
+
+def section_sort_key(section):
+    if not section:
+        return (len(_SECTION_PARTS), ())
+    first = re.split(r"/| 또는 ", section)[0]
+    return (_SECTION_PARTS[first[0]], tuple(int(n) for n in _SECTION_NUMBERS.findall(first)))
+
+
+def consolidate(row_ids):
+    # row_ids : 판정된 행 id 들 (여러 title_key · 여러 제품의 결과를 이어 붙여도 된다)
+    # 반환값 : {"report_tag": 가장 엄격한 태그 또는 None, "sections": ((CTD 항목, (문서 id, …)), …)}
+    ranks = row_tag_ranks()
+    refs = row_documents()
+    strictest = -1
+    seen = {}
+    for row_id in row_ids:
+        strictest = max(strictest, ranks[row_id])
+        for _, document_id in refs[row_id]:
+            seen.setdefault(document_id, None)
+
+    catalog = document_catalog()
+    sections = {}
+    for document_id in seen:
+        sections.setdefault(catalog[document_id][0], []).append(document_id)
+    return {
+        "report_tag": REPORT_TAG_ORDER[strictest] if strictest >= 0 else None,
+        "sections": tuple(
+            (section, tuple(sections[section]))
+            for section in sorted(sections, key=section_sort_key)
+        ),
+    }
+
+
+def consolidate_results(step7_results, title_keys=None):
+    # st.session_state.step7_results (Step7Results) 의 통합 목록
+    if title_keys is None:
+        title_keys = list(step7_results)
+    return consolidate(
+        row_id
+        for title_key in title_keys
+        if title_key in step7_results
+        for row_id in step7_results.row_ids(title_key)
+    )
@@ -0,0 +1,110 @@
+import argparse
+import io
+import json
+import re
+import sys
+import time
+import zipfile
+
+from step8_form import evaluate_form_key, form_xlsx
+from step_pipeline import run_chunks
+
+# ===== Step 8 신청양식 일괄 생성 =====
+# 입력 한 줄 : {"product": "...", "step6_targets": [...], "step6_selections": {...}}
+# 각 답변 세트를 판정하여 신청양식 .xlsx 를 만들고 하나의 ZIP 에 순서대로 기록한다.
+# 완성된 파일은 즉시 ZIP 에 쓰고 버리므로, 메모리에는 처리 중인 청크만 남는다.
+# 항목별 소요 시간과 실패 사유는 --report JSONL 로, 요약은 표준오류로 출력한다.
+#
+#     python step8_bulk.py answers.jsonl -o forms.zip --report report.jsonl --workers 8
+
+CHUNK_SIZE = 50
+
+_UNSAFE_NAME = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+def entry_name(line_no, product):
+    name = _UNSAFE_NAME.sub("_", str(product)).strip("_") or "form"
+    return f"{line_no:06d}_{name}.xlsx"
+
+
+def render_line(line_no, line):
+    # (줄 번호, 제품명, xlsx bytes 또는 None, 오류 또는 None, 소요 초)
+    started = time.perf_counter()
+    product = line_no
+    try:
+        record = json.loads(line)
+        product = record.get("product", line_no)
+        key = evaluate_form_key(record["step6_targets"], record["step6_selections"])
+        data = form_xlsx(key)
+    except (ValueError, KeyError, TypeError, AttributeError) as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        return line_no, product, None, error, time.perf_counter() - started
+    return line_no, product, data, None, time.perf_counter() - started
+
+
+def render_chunk(numbered_lines):
+    return [render_line(line_no, line) for line_no, line in numbered_lines]
+
+
+def run(lines, workers=1, chunk_size=CHUNK_SIZE):
+    # 빈 줄은 건너뛰되 ZIP 항목 이름 · 보고서에는 원래 줄 번호를 사용
+    return run_chunks(render_chunk, lines, workers, chunk_size, skip_blank=True)
+
+
+def write_zip(results, archive, report=None):
+    # .xlsx 는 이미 압축된 파일이므로 ZIP 에는 압축 없이 저장
+    summary = {"forms": 0, "failures": 0}
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_STORED) as bundle:
+        for line_no, product, data, error, seconds in results:
+            entry = {"line": line_no, "product": product, "seconds": round(seconds, 6)}
+            if error is None:
+                entry["file"] = entry_name(line_no, product)
+                bundle.writestr(entry["file"], data)
+                summary["forms"] += 1
+            else:
+                entry["error"] = error
+                summary["failures"] += 1
+            if report is not None:
+                report.write(json.dumps(entry, ensure_ascii=False))
+                report.write("\n")
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Step 6 답변 세트(JSON Lines)마다 신청양식 .xlsx 를 만들어 ZIP 으로 출력합니다."
+    )
+    parser.add_argument("input", nargs="?", default="-", help="입력 JSONL 파일 (기본값: 표준입력)")
+    parser.add_argument("-o", "--output", default="-", help="출력 ZIP 파일 (기본값: 표준출력)")
+    parser.add_argument("--report", help="항목별 소요 시간 · 실패 사유 JSONL 파일")
+    parser.add_argument("--workers", type=int, default=1, help="병렬 처리 프로세스 수")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="프로세스당 전달할 줄 수")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.input == "-":
+        source = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    else:
+        source = open(args.input, encoding="utf-8")
+    archive = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    report = open(args.report, "w", encoding="utf-8") if args.report else None
+    try:
+        summary = write_zip(run(source, args.workers, args.chunk_size), archive, report)
+    finally:
+        source.close()
+        if archive is not sys.stdout.buffer:
+            archive.close()
+        if report is not None:
+            report.close()
+
+    elapsed = time.perf_counter() - started
+    rate = summary["forms"] / elapsed * 60 if elapsed else 0.0
+    print(
+        f"신청양식 {summary['forms']}건 생성, 실패 {summary['failures']}건, "
+        f"{elapsed:.1f}초 (분당 {rate:.0f}건)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
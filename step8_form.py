@@ -0,0 +1,97 @@
+import io
+from functools import lru_cache
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle
+
+from step7_artifact import load_artifact
+from step7_engine import check_request, evaluate_title_key_rows, row_result
+
+# ===== Step 8 신청양식 (Streamlit 비의존) =====
+# step7_results 의 title_key 별 행 id 만으로 신청양식 행을 구성하고
+# openpyxl write-only 모드로 메모리 버퍼에 .xlsx 를 기록한다.
+# 같은 판정 결과(양식 키)에 대한 파일은 프로세스당 한 번만 생성된다.
+
+FORM_SHEET = "신청양식"
+FORM_FILE_NAME = "신청양식.xlsx"
+FORM_HEADER = ("순번", "변경항목", "보고유형", "보고유형 안내", "필요서류")
+FORM_COLUMN_WIDTHS = (6, 40, 10, 60, 80)
+
+NO_MATCH_TEXT = (
+    "해당 변경사항에 대한 충족조건을 고려하였을 때,\n"
+    "「의약품 허가 후 제조방법 변경관리 가이드라인」에서 제시하고 있는\n"
+    "범위에 해당하지 않는 것으로 확인됩니다"
+)
+
+# 양식 키 → .xlsx bytes LRU 캐시 크기 (프로세스 전체 공유)
+FORM_CACHE_SIZE = 256
+
+
+def form_key(step6_targets, step7_results):
+    # 양식 내용을 결정하는 값 : step6_targets 순서의 (title_key, 행 id 튜플)
+    return tuple(
+        (title_key, tuple(step7_results.row_ids(title_key)))
+        for title_key in step6_targets
+        if title_key in step7_results
+    )
+
+
+def evaluate_form_key(step6_targets, step6_selections):
+    # step7_results 없이 답변 세트에서 바로 양식 키를 만든다 (일괄 생성용)
+    check_request(step6_selections, step6_targets)
+    return tuple(
+        (title_key, evaluate_title_key_rows(title_key, step6_selections))
+        for title_key in step6_targets
+    )
+
+
+def form_rows(key):
+    # (순번, 변경항목, 보고유형, 보고유형 안내, 필요서류) — 해당 행이 없으면 범위 외 안내 1행
+    step6_items = load_artifact("catalog")["step6_items"]
+    for number, (title_key, row_ids) in enumerate(key, start=1):
+        title = step6_items[title_key]["title"]
+        if not row_ids:
+            yield (number, title, "", NO_MATCH_TEXT, "")
+        for row_id in row_ids:
+            output_1_tag, output_1_text, output_2_text = row_result(row_id)
+            yield (number, title, output_1_tag, output_1_text, output_2_text)
+
+
+# 셀마다 서식 객체를 만들지 않도록 통합문서에 이름 있는 서식으로 한 번 등록해 둔다
+FORM_STYLES = {
+    "신청양식 제목": {"font": Font(bold=True), "alignment": Alignment(wrap_text=True, vertical="top")},
+    "신청양식 본문": {"alignment": Alignment(wrap_text=True, vertical="top")},
+}
+
+
+def _cell(sheet, value, style):
+    cell = WriteOnlyCell(sheet, value=value)
+    cell.style = style
+    return cell
+
+
+def write_form(key, stream):
+    # 항목 키 오류는 통합문서를 만들기 전에 드러나도록 행을 먼저 구성
+    rows = list(form_rows(key))
+    workbook = Workbook(write_only=True)
+    for name, attributes in FORM_STYLES.items():
+        workbook.add_named_style(NamedStyle(name, **attributes))
+    sheet = workbook.create_sheet(FORM_SHEET)
+    for index, width in enumerate(FORM_COLUMN_WIDTHS):
+        sheet.column_dimensions[chr(ord("A") + index)].width = width
+    sheet.append([_cell(sheet, value, "신청양식 제목") for value in FORM_HEADER])
+    for row in rows:
+        sheet.append([_cell(sheet, value, "신청양식 본문") for value in row])
+    workbook.save(stream)
+
+
+@lru_cache(maxsize=FORM_CACHE_SIZE)
+def form_xlsx(key):
+    buffer = io.BytesIO()
+    write_form(key, buffer)
+    return buffer.getvalue()
+
+
+def form_cache_info():
+    return form_xlsx.cache_info()
@@ -0,0 +1,383 @@
+# ===== Step5 · Step6 항목 정의 (전체 하드코딩) =====
+# Streamlit 없이 불러올 수 있도록 앱 스크립트에서 분리한 항목 카탈로그
+
+step5_items = {
+    "s1": {
+        "title": "3.2.S.1 일반정보",
+        "items": {
+            "1": "1. 원료의약품 명칭변경"
+        }
+    },
+    "s2": {
+        "title": "3.2.S.2 제조",
+        "items": {
+            "2": "2. 원료의약품의 제조소 또는 제조업자의 변경 또는 추가",
+            "3": "3. 원료의약품 제조 공정의 변경",
+            "4": "4. 원료의약품 제조 공정관리 규격의 변경",
+            "5": "5. 원료의약품 또는 중간체의 제조 규모 변경",
+            "6": "6. 원료의약품의 제조에 사용되는 원료(출발물질, 중간체, 용매, 시약 등)의 규격변경"
+        }
+    },
+    "p1": {
+        "title": "3.2.P.1 완제의약품의 성상 및 조성",
+        "items": {
+            "7": "7. 완제의약품 중 고형 제제의 조성 변경",
+            "8": "8. 완제의약품 중 고형 제제의 코팅층 무게 변경",
+            "9": "9. 완제의약품 중 고형제제를 제외한 그 외 제형의 조성 변경",
+            "10": "10. 완제의약품 중 고형제제를 제외한 그 외 제형에 쓰이는 착색제 또는 착향제의 종류와 분량의 변경"
+        }
+    },
+    "p3": {
+        "title": "3.2.P.3 제조",
+        "items": {
+            "11": "11. 정성적 또는 정량적인 조성과 평균 질량의 변경이 없는 성상의 변경(단 잉크, 그림, 글자체 등 식별표시를 위한 변경은 제외)",
+            "12": "12. 완제의약품 제조공정 중 일부공정 제조소 또는 전체공정 제조소의, 추가 또는 변경",
+            "13": "13. 비무균제제의 제조 규모 변경",
+            "14": "14. 무균제제의 제조 규모 변경",
+            "15": "15. 완제의약품의 제조공정 변경",
+            "16": "16. 완제의약품 또는 반제품의 제조에 적용되는 공정관리시험 또는 공정관리시험 기준(IPC)의 변경"
+        }
+    },
+    "p4": {
+        "title": "3.2.P.4 첨가제의 관리",
+        "items": {
+            "17": "17. 첨가제 기원의 변경",
+            "18": "18. 별규에 해당하는 첨가제의 규격 또는 시험방법변경",
+            "19": "19. 식약처장이 인정하는 공정서 규격으로 첨가제 규격의 변경"
+        }
+    },
+    "p7": {
+        "title": "3.2.P.7 용기-마개 시스템",
+        "items": {
+            "20": "20. 비무균제제의 직접용기 및 포장재질, 종류 변경",
+            "21": "21. 무균제제의 직접용기 및 포장 재질, 종류 변경",
+            "22": "22. 직접 포장의 규격 변경",
+            "23": "23. 포장단위 변경"
+        }
+    },
+    "ds": {
+        "title": "디자인스페이스(Design Space)",
+        "items": {
+            "24": "24. 디자인스페이스(Design Space) 변경"
+        }
+    }
+}
+
+step6_items = {
+    "s1_1": {
+        "title": "3.2.S.1 일반정보\n1. 원료의약품 명칭변경",
+        "subitems": {},
+        "requirements": {
+            "1": "1. 유효성분은 그대로 유지된다."
+        }
+    },
+    "s2_2": {
+        "title": "3.2.S.2 제조\n2. 원료의약품의 제조소 또는 제조업자의 변경 또는 추가",
+        "subitems": {
+            "2a": "2a. 원료의약품의 출발물질 생산",
+            "2b": "2b. 원료의약품의 중간체 생산",
+            "2c": "2c. 원료의약품의 생산"
+        },
+        "requirements": {
+            "1": "1. 무균 원료의약품이 아니다.",
+            "2": "2. 변경된 제조소의 원료의약품은 완제연계심사로서 DMF 품질심사를 완료하였다.",
+            "3": "3. 원료의약품 규격에는 변경이 없다.",
+            "4": "4. 출발 물질의 규격, 불순물 프로파일 및 합성경로는 변경이 없다.",
+            "5": "5. 규격(공정 중 관리, 모든 원료의 분석 방법 포함), 제조 방법, 상세한 합성 경로 및 중간체 규격의 변경이 없다.",
+            "6": "6. 원료의약품의 경우, 그 결정형이 동일하고, 입자크기가 중요한 경우 입자 크기 분포에 유의한 차이가 없다.",
+            "7": "7. 원료의약품의 규격 (공정 중 관리, 모든 원료의 분석 방법 포함), 제조 방법 (배치 크기 포함) 및 상세한 합성 경로는 변경이 없다.",
+            "8": "8. 사람 또는 동물 유래 물질이 사용되는 경우, BSE/TSE 위험에 대한 평가가 필요한 새로운 공급자를 이용하지 않는다.",
+            "9": "9. 출발물질은 조품의 원료, 등록대상 원료의약품의 성분, 등록하고자 하는 원료의약품과 화학구조가 유사한 성분에 해당하지 않는다.",
+            "10": "10. 실제 제조장소의 변경이 없는 제조소의 명칭 변경이다."
+        }
+    },
+    "s2_3": {
+        "title": "3.2.S.2 제조\n3. 원료의약품 제조 공정의 변경",
+        "subitems": {},
+        "requirements": {
+            "1": "1. 원료의약품의 물리적 성질(결정형, 비결정형 등)에 변경이 없다.",
+            "2": "2. 난용성 원료의약품의 경우, 결정다형이 동일하고 입자 크기가 중요한 경우 입자 크기 분포에 유의한 차이가 없다.",
+            "3": "3. 사람 또는 동물 유래 물질이 사용되는 경우, 바이러스 안정성 평가 및 BSE/TSE 위험에 대한 평가가 필요한 새로운 공정이 포함되지 않는다.",
+            "4": "4. 합성경로의 변경이 없고(중간체는 동일하게 유지됨) 새로운 시약, 촉매 혹은 용매가 사용되지 않는다.",
+            "5": "5. 원료의약품의 정성적 및 정량적 불순물 프로파일이나 물리 화학적 성질의 변경이 없다.",
+            "6": "6. 무균 원료의약품의 멸균 또는 무균 공정에 영향을 미치지 않는다.",
+            "7": "7. 최종 중간체 이전 공정의 변경이다.",
+            "8": "8. 변경 전·후, 출발물질 규격, 중간체 규격 또는 원료의약품 규격의 변경이 없다.",
+            "9": "9. 원료의약품 규격에 변경이 없다."
+        }
+    },
+    "s2_4": {
+        "title": "3.2.S.2 제조\n4. 원료의약품 제조 공정관리 규격의 변경",
+        "subitems": {
+            "4a": "4a. 공정관리 기준 강화",
+            "4b": "4b. 공정관리 시험 및 기준 추가",
+            "4c": "4c. 안전성이나 품질 문제로 인한 공정 관리 시험의 추가 또는 교체",
+            "4d": "4d. 공정관리 시험 삭제",
+            "4e": "4e. 공정관리 시험 기준 완화"
+        },
+        "requirements": {
+            "1": "1. 해당 변경은 제조 중 예기치 않은 사례로 발생한 것이 아니다.",
+            "2": "2. 해당 변경은 현재 승인된 기준 범위 내에 있다.",
+            "3": "3. 분석 절차는 동일하다. (분석절차의 경미한 변경은 허용)",
+            "4": "4. 삭제되는 공정관리 시험은 품질에 영향을 미치지 않는다.",
+            "5": "5. 해당 변경은 무균 원료의약품의 멸균 공정에 영향을 주지 않는다."
+        }
+    },
+    "s2_5": {
+        "title": "3.2.S.2 제조\n5. 원료의약품 또는 중간체의 제조 규모 변경",
+        "subitems": {
+            "5a": "5a. 제조 규모의 10배 이하 확대",
+            "5b": "5b. 제조 규모의 축소",
+            "5c": "5c. 제조 규모의 10배 초과 확대"
+        },
+        "requirements": {
+            "1": "1. 제조방법 및 공정관리의 변경은 제조규모 변경에 따른 변경만을 포함한다.",
+            "2": "2. 제조 공정의 재현성에 영향이 없다.",
+            "3": "3. 제조과정에서 예상하지 못한 사유로 기준을 충족하지 못한 경우 또는 안정성 문제 때문에 발생한 변경이 아니다."
+        }
+    },
+    "s2_6": {
+        "title": "3.2.S.2 제조\n6. 원료의약품의 제조에 사용되는 원료의 규격변경",
+        "subitems": {
+            "6a": "6a. 규격 기준의 강화",
+            "6b": "6b. 시험방법의 변경",
+            "6c": "6c. 기준 및 시험방법 추가",
+            "6d": "6d. 기준 또는 시험방법의 삭제",
+            "6e": "6e. 안전성이나 품질관리 문제로 인한 기준의 추가 또는 교체",
+            "6f": "6f. 원료약품(용매, 시약, 촉매 등)에 대한 기준 완화",
+            "6g": "6g. 원료의약품 출발물질 및 핵심중간체에 대한 기준 완화"
+        },
+        "requirements": {
+            "1": "1. 제조과정에서 예상하지 못한 사유로 기준을 충족하지 못한 경우 또는 안정성 문제 때문에 발생한 변경이 아니다.",
+            "2": "2. 모든 변경 사항은 현재의 허용 기준범위 내에 있다.",
+            "3": "3. 시험방법의 변경은 없다.",
+            "4": "4. 변경 후 시험방법은 동일한 분석 기술 또는 원리로 수행된다.",
+            "5": "5. 변경 후 시험법 밸리데이션은 적절하게 수행되었으며, 이전 시험방법과 동등 이상이다.",
+            "6": "6. 원료의약품의 총 불순물 기준 변경은 없으며, 새로 검출되는 불순물은 없다.",
+            "7": "7. 변경은 유전독성 불순물의 관리전략에 영향을 미치지 않는다.",
+            "8": "8. 변경되는 시험항목은 중요하지 않거나 승인된 대체 시험항목이 있다.",
+            "9": "9. 회수용매의 기준과 관련되어 있지 않다."
+        }
+    },
+    "p1_7": {
+        "title": "3.2.P.1 완제의약품의 성상 및 조성\n7. 완제의약품 중 고형 제제의 조성 변경",
+        "subitems": {
+            "7a": "7a. 타르색소(황색4호 제외)의 종류 변경",
+            "7b": "7b. 착색제 또는 착향제의 종류 및 분량 변경",
+            "7c": "7c. 첨가제의 종류 및 분량 변경"
+        },
+        "requirements": {
+            "1": "1. 제형의 기능적 특성 및 제품 품질(붕해시간 혹은 용출프로파일 등)에 미치는 영향은 없다.",
+            "2": "2. 단위제형 총 중량 중 착색제, 착향제간의 함유율의 차는 없으며, 기허가 품목(동일투여경로)에 사용된 예가 있다.",
+            "3": "3. 해당 변경은 안정성 문제로 인한 것이 아니며, 잠재적인 안전성 우려, 즉 용량 간의 구별 문제를 야기하지 않는다.",
+            "4": "4. 변경/추가되는 첨가제는 \u300C의약품의 품목허가·신고·심사 규정\u300D 제25조제2항제1호에 따른 새로운 첨가제가 아니다.",
+            "5": "5. 변경/추가되는 첨가제의 규격은 공정서 규격에 해당한다."
+        }
+    },
+    "p1_8": {
+        "title": "3.2.P.1 완제의약품의 성상 및 조성\n8. 고형제제의 코팅층 무게 변경",
+        "subitems": {},
+        "requirements": {}
+    },
+    "p1_9": {
+        "title": "3.2.P.1 완제의약품의 성상 및 조성\n9. 완제의약품(고형제제 제외)의 조성 변경",
+        "subitems": {},
+        "requirements": {
+            "1": "1. 시럽제, 엘릭서제, 틴크제 등 경구용 액제 및 외용액제(유제 및 현탁제 제외)",
+            "2": "2. 주사제, 점안제, 점이제로 원료약품의 종류가 이미 허가·신고사항과 동일하거나 다음의 첨가제가 다른 경우 : \u300C의약품의 품목허가·신고·심사 규정\u300D 제27조제3항제2호에 따라 주사제는 보존제, 완충제, 항산화제, pH조절제(이미 허가·신고된 바있는 주사제에 사용된 pH조절제에 한함), 점안제 및 점이제는 보존제, 완충제, 등장화제, 점도조절제, pH조절제.",
+            "3": "3. 흡입 전신마취제",
+            "4": "4. 국소적용 외용제제로서 원료약품 종류 동일하고, 첨가제가 다른 경우",
+            "5": "5. 유효성분을 기체나 증기 형태로 흡입하는 국소요법 제제",
+            "6": "6. 수액제, 혈액증량제 및 인공관류액 제제",
+            "7": "7. 폐에 적용하는 흡입제",
+            "8": "8. 위 충족조건에 포함되지 않는 경우",
+            "9": "9. 첨가제는 새로운 첨가제가 아니다."
+        }
+    },
+    "p1_10": {
+        "title": "3.2.P.1 완제의약품의 성상 및 조성\n10. 완제의약품(고형제제 제외)에 쓰이는 착색제 또는 착향제의 종류와 분량의 변경",
+        "subitems": {
+            "10a": "10a. 타르색소의 종류 변경(황색4호 제외)",
+            "10b": "10b. 타르색소의 종류 및 분량 변경",
+            "10c": "10c. 타르색소 외 착색제, 착향제의 변경"
+        },
+        "requirements": {
+            "1": "1. 제형의 성능에 관한 시험결과(예: 붕해시간 및 용출프로파일)에 변화가 없다.",
+            "2": "2. 총 중량을 유지하기 위해 주요 첨가제를 써서 처방 조성이 경미하게 조정되어 있다.",
+            "3": "3. 완제의약품의 규격은 성상, 냄새 및/또는 맛에 대해서만 개정되었거나 확인시험 변경에 국한된다.",
+            "4": "4. 타르색소 착색제는 지정 고시에 적합하다.",
+            "5": "5. 착향제는 기허가 품목(동일 투여경로)에 사용된 예가 있다.",
+            "6": "6. 첨가제는 국제공통기술문서 3.2.P.4를 준수한다.",
+            "7": "7. 유래물질이 있을 경우, BSE/TSE 위해 적합성 평가 자료가 있다.",
+            "8": "8. 변경 사항은 용량 간 식별에 영향을 미치지 않는다.",
+            "9": "9. 새로운 첨가제가 아니다."
+        }
+    },
+    "p3_11": {
+        "title": "3.2.P.3 제조\n11. 정성적 또는 정량적인 조성과 평균 질량의 변경이 없는 성상의 변경",
+        "subitems": {
+            "11a": "11a. 11b에 언급된 것 이외의 정제, 캡슐, 좌제",
+            "11b": "11b. 장용성, 서방성 완제의약품"
+        },
+        "requirements": {
+            "1": "1. 완제의약품의 규격은 모양에 대해서만 변경되어 있다.",
+            "2": "2. 변경 전·후 최소 1배치의 용출 프로파일은 동등하다.",
+            "3": "3. 성형공정의 변경으로 인한 외형 변화이며 식별표시는 해당하지 않는다."
+        }
+    },
+    "p3_12": {
+        "title": "3.2.P.3 제조\n12. 완제의약품 제조공정의 일부 또는 전부에 대한 제조소 추가 또는 변경",
+        "subitems": {
+            "12a": "12a. 이차 포장 제조소",
+            "12b1": "12b.1. 일차 포장 제조소 – 고형(정제, 캡슐제), 반고형(연고제, 크림제) 및 액상 제제",
+            "12b2": "12b.2. 일차 포장 제조소 – 그 밖의 액상 제제(유제, 현탁제)",
+            "12c1": "12c1. 원료칭량 공정 및 완제품 포장공정 제조소를 제외한 그 밖의 모든 제조소",
+            "12c2": "12c2. 원료칭량 공정 및 완제품 포장공정 제조소를 제외한 그 밖의 모든 제조소"
+        },
+        "requirements": {
+            "1": "1. 배치 조성, 제조 공정 및 공정 관리의 기록 사항, 장비 등급 및 공정 관리, 주요 공정 및 반제품의 관리 또는 완제의약품 규격에 있어서 변경이 없다.",
+            "2": "2. (해당하는 경우) 해당 품목을 제조하는 제조소에 ‘의약품 등의 안전에 관한 규칙’ 제48조의2에 따른 제조 및 품질관리기준 적합판정서가 있거나, 해외 제조원인 경우 제4조제1항제4호에 따른 유효기간 내의 제조증명서가 있다.",
+            "3": "3. 무균제제가 아니다.",
+            "4": "4. 포장 재질의 변경이 없다.",
+            "5": "5. 액상제제(경구용 액제, 주사제, 점안제, 점이제 등), 폐에 적용하는 흡입제 및 반고형제제에 해당한다. (유제 및 현탁제 제외)"
+        }
+    },
+    "p3_13": {
+        "title": "3.2.P.3 제조\n13. 비무균제제의 제조 규모 변경",
+        "subitems": {
+            "13a": "13a. 대조약과 의약품동등성 입증 또는 임상시험을 실시한 제제의 10배수 이하 변경",
+            "13b": "13b. 일반 제제에서 10배 초과 생산 규모 변경",
+            "13c": "13c. 특수성이 인정되는 제제 및 반고형제제에서 10배 초과 생산규모 변경"
+        },
+        "requirements": {
+            "1": "1. 해당 변경은 제제의 재현성 및/또는 일관성에 영향을 미치지 않는다.",
+            "2": "2. 제조장비의 작동원리 및 디자인이 동일하고, 제조 공정의 변경은 제조 규모에 따른 것이다.",
+            "3": "3. 위험도 평가 또는 밸리데이션 실시 계획서에 따라 생산 규모 3배치 밸리데이션이 성공적으로 수행되었다.",
+            "4": "4. 변경은 예기치 않은 사례나 안정성 문제로 인한 것이 아니다.",
+            "5": "5. 일반제제에 해당한다.",
+            "6": "6. 액상제제에 해당한다."
+        }
+    },
+    "p3_14": {
+        "title": "3.2.P.3 제조\n14. 무균제제의 제조 규모 변경",
+        "subitems": {},
+        "requirements": {
+            "1": "1. 해당 변경은 생산 일관성에 영향을 주지 않는다.",
+            "2": "2. 원료약품 및 그 분량에는 변경이 없다.",
+            "3": "3. 의약품의 규격 변경이 없다.",
+            "4": "4. 위험도 평가 또는 밸리데이션 실시 계획서에 따라 생산 규모 3배치 밸리데이션이 성공적으로 수행되었다.",
+            "5": "5. 액상제제로서 제조 규모 변경이 10배 초과이다.",
+            "6": "6. 특수성이 인정되는 제제, 반고형제제 또는 분말형 주사제로서 제조 규모 변경이 10배 초과이다."
+        }
+    },
+    "p3_15": {
+        "title": "3.2.P.3 제조\n15. 완제의약품의 제조공정 변경",
+        "subitems": {
+            "15a": "15a. 완제의약품의 제조공정 변경",
+            "15b": "15b. 완제의약품의 제조공정 변경(예 : 용출에 영향을 주는 첨가제 등급 변경, 결합액의 용매 양 변경, 용출에 영향을 주는 첨가제의 투입순서 변경, 코팅액의 용매 변경 등)",
+            "15c": "15c. 완제의약품의 제조공정 변경(예 :결합액의 용매 종류 변경 등)"
+        },
+        "requirements": {
+            "1": "1. 불순물 프로파일의 변경이 없고 물리 화학적 성질에 변경이 없다. 용출 프로파일은 대조약 배치의 프로파일과 유사하다.",
+            "2": "2. 변경 전·후 제제의 제조공정은 동일한 원리이고 반제품은 동일하며, 공정에 사용되는 제조 용매에는 변경이 없다(습식 조립법에서 건식 조립법으로의 변경, 직접 분말 압축법에서 습식 또는 건식 과립 압축법으로의 변경, 또는 그 반대로의 변경은 제조 원리의 변경으로 간주된다).",
+            "3": "3. 변경 전·후 작동원리가 같은 동일 계열의 제조장비를 사용한다.(제조장비의 작동원리 및 디자인의 동일 여부는 [부록 1], [부록 2]를 참고한다.)",
+            "4": "4. 완제의약품의 품질에 영향을 미치는 제조공정(주요공정) 조건의 변동이 없다.",
+            "5": "5. 반제품 또는 완제의약품의 규격 변경은 없다.",
+            "6": "6. 제조 중에 발생하는 예기치 않은 사례로 인한 규격 미충족 또는 안정성 문제 때문에 발생한 변경은 아니다.",
+            "7": "7. 해당 변경은 계량 및/또는 전달 기능을 제공하는 일차 포장과 관련된 포장이나 라벨링 공정을 포함하지 않는다.",
+            "8": "8. 일반제제에 해당한다(장용성 및 방출조절제제, 서방성제제 등 제형의 특수성이 인정되는 제제 제외).",
+            "9": "9. 액상제제(경구용 액제, 주사제, 점안제, 점이제 등)에 해당한다."
+        }
+    },
+    "p3_16": {
+        "title": "3.2.P.3 제조\n16. 완제의약품 또는 반제품의 제조에 적용되는 공정관리시험 또는 공정관리시험 기준(IPC)의 변경",
+        "subitems": {
+            "16a": "16a. 공정관리시험 기준의 변경",
+            "16b": "16b. 공정관리시험 기준의 변경",
+            "16c": "16c. 공정관리시험 항목의 삭제",
+            "16d": "16d. 새로운 공정관리시험 기준의 추가",
+            "16e": "16e. 공정관리시험 방법의 변경"
+        },
+        "requirements": {
+            "1": "1. 해당 변경은 공정관리 기준(예, 마손도, 경도, 입도, 밀도, 수분 등) 범위 내에 있다.",
+            "2": "2. 해당 변경은 제조 중에 발생하는 예기치 않은 사례로 인한 규격 미충족 또는 안정성 문제로 인하여 필요로 하는 것이 아니다.",
+            "3": "3. 삭제된 공정관리 항목은 불필요하거나 생략 가능한 것으로 입증되었으며, 제제의 주요 품질 특성(예: 혼합균일성, 질량편차)에 미치는 영향이 없거나 적다.",
+            "4": "4. 시험방법에는 변경이 없다."
+        }
+    },
+    "p4_17": {
+        "title": "3.2.P.4 첨가제의 관리\n17. 첨가제 기원의 변경",
+        "subitems": {
+            "17a": "17a. 동물성 기원 → 식물 또는 합성 기원",
+            "17b": "17b. 식물 또는 합성 기원 → 동물성 기원 또는 다른 동물성 기원"
+        },
+        "requirements": {
+            "1": "1. 첨가제와 완제의약품의 규격에는 변경이 없다."
+        }
+    },
+    "p4_18": {
+        "title": "3.2.P.4 첨가제의 관리\n18. 별규에 해당하는 첨가제의 규격 또는 시험방법 변경",
+        "subitems": {},
+        "requirements": {
+            "1": "1. 해당 변경은 제조 과정 중 예기치 않은 사례로 인한 규격 미충족 또는 안정성 문제로 인해 발생한 변경이 아니다."
+        }
+    },
+    "p4_19": {
+        "title": "3.2.P.4 첨가제의 관리\n19. 식약처장이 인정하는 공정서 규격으로 첨가제 규격의 변경",
+        "subitems": {},
+        "requirements": {
+            "1": "1. 공정서를 준수하기 위해 요구되는 규격 이외에는 변경이 없다. (예: 입자 크기 분포의 변경 없음)"
+        }
+    },
+    "p7_20": {
+        "title": "3.2.P.7 용기-마개 시스템\n20. 비무균제제의 직접용기 및 포장 재질, 종류 변경",
+        "subitems": {},
+        "requirements": {
+            "1": "1. 고형제제로서 주성분, 제형, 투여경로가 동일한 기허가 의약품에서 사용례가 확인되는 용기 재질로의 변경 또는 동일한 종류/보호성 동등 이상인 재질로의 변경이며, 사용기간은 기허가의약품 사용기간을 초과하지 않는다."
+        }
+    },
+    "p7_21": {
+        "title": "3.2.P.7 용기-마개 시스템\n21. 무균제제의 직접용기 및 포장 재질, 종류 변경",
+        "subitems": {},
+        "requirements": {
+            "1": "1. 변경 후 용기의 보호성 등이 동등 이상이고 상호작용 위험이 없다."
+        }
+    },
+    "p7_22": {
+        "title": "3.2.P.7 용기-마개 시스템\n22. 직접 포장의 규격 변경",
+        "subitems": {
+            "22a": "22a. 규격 기준의 강화",
+            "22b": "22b. 시험 항목의 추가 또는 삭제"
+        },
+        "requirements": {
+            "1": "1. 모든 변경 사항은 현재의 허용 기준범위 내에 있다.",
+            "2": "2. 해당 변경은 제조 과정에서 발생하는 예기치 않은 사례로 인한 규격 미충족 혹은 안정성 문제 때문에 발생한 변경이 아니다."
+        }
+    },
+    "p7_23": {
+        "title": "3.2.P.7 용기-마개 시스템\n23. 포장단위 변경",
+        "subitems": {},
+        "requirements": {
+            "1": "1. 해당 변경은 제조 과정에서 발생하는 예기치 않은 사례로 인한 규격 미충족 혹은 안정성 문제 때문에 발생한 변경이 아니다.",
+            "2": "2. 이외 허가사항의 변경은 없다."
+        }
+    },
+    "ds_24": {
+        "title": "디자인스페이스(Design Space)\n24. 새로운 디자인스페이스 도입 또는 허가된 디자인스페이스의 확장",
+        "subitems": {
+            "24a": "24a. 완제의약품/원료의약품 제조공정에서 하나 이상의 단위 조작 변경(공정 중 관리 및/또는 시험방법 포함)",
+            "24b": "24b. 첨가제/반제품 및/또는 완제의약품/원료의약품의 시험방법 변경"
+        },
+    }
+}
+
+# Step 6 하위항목 자동 동기화 쌍 (한쪽을 선택하면 다른 쪽도 같은 값으로 저장)
+step6_sync_pairs = {
+    "12c1": "12c2",
+    "12c2": "12c1",
+    "16a": "16b",
+    "16b": "16a",
+}
+
+# 하위항목이 모두 "변경 있음"으로 고정되는 항목
+step6_fixed_subitems = ("p3_15",)
@@ -0,0 +1,36 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# ===== JSON Lines 일괄 처리 공용 파이프라인 =====
+# 입력 줄을 (줄 번호, 줄) 청크로 나누어 프로세스 풀에서 처리하고, 결과를 입력 순서대로 내보낸다.
+# 처리 중인 청크 수를 작업자 수의 2배로 제한해 입력 크기와 무관하게 메모리를 일정하게 유지한다.
+# process_chunk 는 다른 프로세스에서 실행되므로 모듈 최상위 함수여야 한다.
+# step7_cli.py · step8_bulk.py 가 함께 사용한다.
+
+
+def iter_chunks(lines, chunk_size, skip_blank=False):
+    # 줄 번호는 1부터, 빈 줄을 건너뛰어도 원래 번호를 유지
+    numbered = enumerate(lines, start=1)
+    if skip_blank:
+        numbered = ((line_no, line) for line_no, line in numbered if line.strip())
+    while chunk := list(islice(numbered, chunk_size)):
+        yield chunk
+
+
+def run_chunks(process_chunk, lines, workers=1, chunk_size=1000, skip_blank=False):
+    # process_chunk([(줄 번호, 줄), …]) → [결과, …] 를 이어 붙여 순서대로 내보낸다
+    chunks = iter_chunks(lines, chunk_size, skip_blank)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from process_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(process_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,62 @@
+import streamlit as st
+
+from step6_answers import Step6Answers
+from step7_artifact import load_artifact
+
+
+# ===== 초기 상태 정의 (세션당 1회) =====
+def init_session_state():
+    if "step" in st.session_state:
+        return
+
+    st.session_state.step = 1
+
+    st.session_state.step1_answer = None
+    st.session_state.step2_answer = None
+    st.session_state.step3_answer = None
+
+    st.session_state.step4_selections = {}
+    st.session_state.step5_targets = []
+
+    st.session_state.step5_selections = {}
+    st.session_state.step6_targets = []
+
+    st.session_state.step6_selections = Step6Answers()
+    st.session_state.step6_page = 0
+    st.session_state.step6_form_mode = False
+
+
+# ===== 선택 상태 정리 (Step 4/5 → 다음 단계 이동 시) =====
+# 대상에서 빠진 항목의 Step 5/6 답변과 step5_radio_* 위젯 키, Step 7 결과를 한 번에 제거한다.
+def reconcile_selections():
+    catalog = load_artifact("catalog")
+
+    step5_targets = set(st.session_state.step5_targets)
+    for code, section in catalog["step5_items"].items():
+        if code in step5_targets:
+            continue
+        for num in section["items"]:
+            key = f"{code}_{num}"
+            st.session_state.step5_selections.pop(key, None)
+            st.session_state.pop(f"step5_radio_{key}", None)
+
+    st.session_state.step6_targets = [
+        title_key
+        for title_key in st.session_state.step6_targets
+        if st.session_state.step5_selections.get(title_key) == "변경 있음"
+    ]
+    st.session_state.step6_page = max(
+        0, min(st.session_state.step6_page, len(st.session_state.step6_targets) - 1)
+    )
+    step6_targets = set(st.session_state.step6_targets)
+    selections = st.session_state.step6_selections
+    for title_key, block in catalog["step6_items"].items():
+        if title_key in step6_targets:
+            continue
+        for sub_key in block.get("subitems", {}):
+            selections.pop(f"{title_key}_sub_{sub_key}", None)
+        for req_key in block.get("requirements", {}):
+            selections.pop(f"{title_key}_req_{req_key}", None)
+
+    if "step7_results" in st.session_state:
+        st.session_state.step7_results.retain(step6_targets)
@@ -0,0 +1,23 @@
+import streamlit as st
+
+
+# ===== Step1 함수 및 화면 =====
+def go_to_step2():
+    if st.session_state.step1_answer == "예":
+        st.session_state.step = 2
+
+def render():
+    st.markdown("## Step 1")
+    st.write("제6조제1항에 따라 국제공통기술문서(CTD)로 작성하여 허가를 받거나 신고한 의약품의 제조원 또는 제조방법을 변경하는 경우에 해당한다.")
+
+    st.session_state.step1_answer = st.radio("답변을 선택하세요.", ["예", "아니오"], key="step1_radio")
+
+    if st.session_state.step1_answer == "예":
+        st.success("""CTD 작성대상 완제의약품 해당합니다.
+(근거 : \u300C의약품의 품목허가·신고·심사 규정\u300D제6조(국제공통기술문서 작성) 제1항, 제3조의2(의약품의 허가ㆍ신고의 변경 처리) 제6항)""")
+        st.button("다음단계로", on_click=go_to_step2)
+
+    elif st.session_state.step1_answer == "아니오":
+        st.warning("""CTD 작성대상 완제의약품 해당여부를 확인하고, 작성 대상에 해당하는 경우 먼저, CTD 제3부 품질평가 자료 중
+3.2.S.2, 3.2.S.3 및 3.2.P.2, 3.2.P.3, 3.2.P.4, 3.2.P.7를 제출하여 제조방법 자료로서 심사 받으시기 바랍니다.
+(근거 : \u300C의약품의 품목허가·신고·심사 규정\u300D제6조(국제공통기술문서 작성) 제1항, 제3조의2(의약품의 허가ㆍ신고의 변경 처리) 제6항)""")
@@ -0,0 +1,25 @@
+import streamlit as st
+
+
+# ===== Step2 함수 및 화면 =====
+def go_to_step3():
+    if st.session_state.step2_answer == "예":
+        st.session_state.step = 3
+
+def render():
+    st.markdown("## Step 2")
+    st.write("제조에 관한 항목 (CTD 제3부 품질평가 자료 중 3.2.S.2, 3.2.S.3 및 3.2.P.2, 3.2.P.3, 3.2.P.4, 3.2.P.7)을 변경 하는 경우에 해당한다.")
+
+    st.session_state.step2_answer = st.radio("답변을 선택하세요.", ["예", "아니오"], key="step2_radio")
+
+    if st.session_state.step2_answer == "예":
+        st.success("""\u300C의약품 허가 후 제조방법 변경관리 가이드라인(민원인 안내서)\u300D의 적용 대상 항목의 변경에 해당합니다.
+(근거 : \u300C의약품의 품목허가·신고·심사 규정\u300D[별표 19])""")
+        st.button("다음단계로", on_click=go_to_step3)
+
+    elif st.session_state.step2_answer == "아니오":
+        st.warning("""제조에 관한 항목은 CTD 제3부 품질평가 자료 중
+3.2.S.2, 3.2.S.3 및 3.2.P.2, 3.2.P.3, 3.2.P.4, 3.2.P.7에 해당하며
+\u300C의약품 허가 후 제조방법 변경관리 가이드라인(민원인 안내서)\u300D는 해당 항목에 대한 변경에 대해 안내하고 있으므로,
+가이드라인 적용 대상에 해당하지 않습니다.
+(근거 : \u300C의약품의 품목허가·신고·심사 규정\u300D[별표 19])""")
@@ -0,0 +1,22 @@
+import streamlit as st
+
+
+# ===== Step3 함수 및 화면 =====
+def go_to_step4():
+    if st.session_state.step3_answer == "예":
+        st.session_state.step = 4
+
+def render():
+    st.markdown("## Step 3")
+    st.write("품목의 허가(신고) 사항 중 제조방법에 해당하는 자료(CTD 제3부 품질평가 자료 중 3.2.S.2, 3.2.S.3 및 3.2.P.2, 3.2.P.3, 3.2.P.4, 3.2.P.7)를 국제공통기술문서(CTD)로서 제출하여 심사받은 ‘제조방법 CTD 적용(또는 전환)’ 품목에 해당한다.")
+
+    st.session_state.step3_answer = st.radio("답변을 선택하세요.", ["예", "아니오"], key="step3_radio")
+
+    if st.session_state.step3_answer == "예":
+        st.success("""\u300C의약품 허가 후 제조방법 변경관리 가이드라인(민원인 안내서)\u300D에 따라 변경수준을 확인할 수 있습니다.  
+(근거 : \u300C의약품의 품목허가·신고·심사 규정\u300D[별표 19])""")
+        st.button("다음단계로", on_click=go_to_step4)
+
+    elif st.session_state.step3_answer == "아니오":
+        st.warning("""먼저, CTD 제3부 품질평가 자료 중 3.2.S.2, 3.2.S.3 및 3.2.P.2, 3.2.P.3, 3.2.P.4, 3.2.P.7를 제출하여 제조방법 자료로서 심사 받으시기 바랍니다.  
+(근거 : \u300C의약품의 품목허가·신고·심사 규정\u300D[별표 19])""")
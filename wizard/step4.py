@@ -0,0 +1,87 @@
+import streamlit as st
+
+from wizard.state import reconcile_selections
+
+
+# ===== Step4 함수 및 화면 =====
+# Step 4 항목 (프롬프트 문구 그대로)
+step4_items = {
+    "s1": "3.2.S.1 일반정보",
+    "s2": "3.2.S.2 제조",
+    "p1": "3.2.P.1 완제의약품의 성상 및 조성",
+    "p3": "3.2.P.3 제조",
+    "p4": "3.2.P.4 첨가제의 관리",
+    "p7": "3.2.P.7 용기-마개 시스템",
+    "ds": "디자인스페이스(Design Space)"
+}
+
+
+# Step 4 → Step 5 이동 함수
+def go_to_step5():
+    st.session_state.step5_targets = [
+        code for code, val in st.session_state.step4_selections.items() if val == "변경 있음"
+    ]
+    reconcile_selections()
+    st.session_state.step = 5
+
+# Step 4 이전단계 복귀 함수
+def go_back_to_step3():
+    st.session_state.step = 3
+
+# Step 4 실행
+def render():
+    st.markdown("## Step 4")
+    st.write("Step 4. 변경사항에 해당하는 항목을 선택하세요.")
+
+    st.markdown("#### 3.2.S 원료의약품")
+    st.session_state.step4_selections["s1"] = st.radio(
+        "3.2.S.1 일반정보",
+        ["변경 있음", "변경 없음"],
+        key="step4_radio_s1"
+    )
+    st.session_state.step4_selections["s2"] = st.radio(
+        "3.2.S.2 제조",
+        ["변경 있음", "변경 없음"],
+        key="step4_radio_s2"
+    )
+
+    st.markdown("#### 3.2.P 완제의약품")
+    st.session_state.step4_selections["p1"] = st.radio(
+        "3.2.P.1 완제의약품의 성상 및 조성",
+        ["변경 있음", "변경 없음"],
+        key="step4_radio_p1"
+    )
+    st.session_state.step4_selections["p3"] = st.radio(
+        "3.2.P.3 제조",
+        ["변경 있음", "변경 없음"],
+        key="step4_radio_p3"
+    )
+    st.session_state.step4_selections["p4"] = st.radio(
+        "3.2.P.4 첨가제의 관리",
+        ["변경 있음", "변경 없음"],
+        key="step4_radio_p4"
+    )
+    st.session_state.step4_selections["p7"] = st.radio(
+        "3.2.P.7 용기-마개 시스템",
+        ["변경 있음", "변경 없음"],
+        key="step4_radio_p7"
+    )
+
+    st.markdown("#### 디자인스페이스")
+    st.session_state.step4_selections["ds"] = st.radio(
+        "디자인스페이스(Design Space)",
+        ["변경 있음", "변경 없음"],
+        key="step4_radio_ds"
+    )
+
+    # 모든 항목 선택 여부 확인
+    all_selected = all(
+        v in ["변경 있음", "변경 없음"]
+        for v in st.session_state.step4_selections.values()
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button("이전단계로", on_click=go_back_to_step3)
+    with col2:
+        st.button("다음단계로", on_click=go_to_step5, disabled=not all_selected)
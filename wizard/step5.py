@@ -0,0 +1,54 @@
+import streamlit as st
+
+from step7_artifact import load_artifact
+from wizard.state import reconcile_selections
+
+
+# ===== Step 간 이동 함수 =====
+def go_to_step6():
+    st.session_state.step6_targets = [
+        key for key, val in st.session_state.step5_selections.items() if val == "변경 있음"
+    ]
+    reconcile_selections()
+    st.session_state.step = 6
+
+def go_back_to_step4():
+    st.session_state.step = 4
+
+# ===== Step5 화면 =====
+def render():
+    step5_items = load_artifact("catalog")["step5_items"]
+
+    st.markdown("## Step 5")
+    st.write("Step 5. 선택한 변경항목 중 변경된 사항을 선택하세요.")
+
+    for code in st.session_state.step5_targets:
+        if code in step5_items:
+            section = step5_items[code]
+            st.markdown(f"#### {section['title']}")
+            for num, label in section["items"].items():
+                key = f"{code}_{num}"
+                if code == "ds":
+                    st.markdown(f"**{label}** → 변경 있음 (자동 선택됨)")
+                    st.session_state.step5_selections[key] = "변경 있음"
+                else:
+                    radio_key = f"step5_radio_{key}"
+                    if radio_key not in st.session_state:
+                        st.session_state[radio_key] = None
+                    st.session_state.step5_selections[key] = st.radio(
+                        label,
+                        ["변경 있음", "변경 없음"],
+                        key=radio_key
+                    )
+
+    all_selected = all(
+        v in ["변경 있음", "변경 없음"]
+        for k, v in st.session_state.step5_selections.items()
+        if not k.startswith("ds_")
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button("이전단계로", on_click=go_back_to_step4)
+    with col2:
+        st.button("다음단계로", on_click=go_to_step6, disabled=not all_selected)
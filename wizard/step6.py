@@ -0,0 +1,223 @@
+import streamlit as st
+
+from step7_artifact import load_artifact
+from step7_engine import Step7Results, step6_key_title_keys
+
+
+# ===== Step6 함수 및 화면 =====
+def go_to_prev_step6_page():
+    if st.session_state.step6_page > 0:
+        st.session_state.step6_page -= 1
+
+def go_to_next_step6_page():
+    if st.session_state.step6_page < len(st.session_state.step6_targets) - 1:
+        st.session_state.step6_page += 1
+
+def go_back_to_step5():
+    st.session_state.step = 5
+
+def go_to_step7():
+    st.session_state.step = 7
+    st.session_state.step7_page = 0
+    # 기존 판정 결과는 유지 : Step 6 에서 답변이 바뀐 title_key 만 dirty 로 표시되어 있다
+    if "step7_results" not in st.session_state:
+        st.session_state.step7_results = Step7Results()
+    # 모든 step6_targets 를 여기서 한 번에 판정 : Step 7 페이지 이동은 렌더링만 수행
+    st.session_state.step7_results.refresh(
+        st.session_state.step6_targets, st.session_state.step6_selections
+    )
+
+# step6_selections 갱신 : 값이 바뀐 경우에만 해당 키를 참조하는 title_key 를 dirty 로 표시
+def set_step6_selection(full_key, value):
+    selections = st.session_state.step6_selections
+    if selections.get(full_key) == value:
+        return
+    selections[full_key] = value
+    title_key = step6_key_title_keys().get(full_key)
+    if title_key is not None and "step7_results" in st.session_state:
+        st.session_state.step7_results.mark_dirty((title_key,))
+
+# 현재 항목의 라디오 영역만 다시 실행되는 fragment : 라디오 클릭은 이 함수만 재실행하고
+# 전체 재실행은 하단 이동 버튼에서만 일어난다.
+@st.fragment
+def render_step6_page(current_key):
+    catalog = load_artifact("catalog")
+    step6_sync_pairs = catalog["step6_sync_pairs"]
+    step6_fixed_subitems = catalog["step6_fixed_subitems"]
+    block = catalog["step6_items"][current_key]
+
+    st.markdown(f"### {block['title']}")
+
+    # 하위항목
+    for sub_key, sub_text in block.get("subitems", {}).items():
+        full_key = f"{current_key}_sub_{sub_key}"
+
+        if current_key in step6_fixed_subitems:
+            set_step6_selection(full_key, "변경 있음")
+            st.radio(sub_text, ["변경 있음"], index=0, key=full_key, disabled=True)
+
+        elif sub_key in step6_sync_pairs:
+            other = step6_sync_pairs[sub_key]
+            other_key = f"{current_key}_sub_{other}"
+
+            current_value = st.session_state.step6_selections.get(full_key, "변경 없음")
+            current_value = st.radio(
+                sub_text,
+                ["변경 있음", "변경 없음"],
+                key=full_key,
+                index=0 if current_value == "변경 있음" else 1
+            )
+
+            set_step6_selection(full_key, current_value)
+            set_step6_selection(other_key, current_value)
+
+        else:
+            set_step6_selection(full_key, st.radio(
+                sub_text,
+                ["변경 있음", "변경 없음"],
+                key=full_key
+            ))
+
+    # 충족요건
+    for req_key, req_text in block.get("requirements", {}).items():
+        full_key = f"{current_key}_req_{req_key}"
+        label = f"{req_key}. {req_text}"
+        set_step6_selection(full_key, st.radio(
+            label,
+            ["충족", "미충족"],
+            key=full_key
+        ))
+
+# ===== Step6 일괄 제출 모드 =====
+# 현재 항목의 라디오를 st.form 안에 두고, 하단 버튼을 누를 때 한 번의 재실행으로
+# step6_selections 에 반영한다. 고정 하위항목과 동기화 쌍은 제출 시점에 적용한다.
+def toggle_step6_form_mode():
+    st.session_state.step6_form_mode = st.session_state.step6_form_mode_toggle
+
+def submit_step6_page(current_key, navigate):
+    catalog = load_artifact("catalog")
+    step6_sync_pairs = catalog["step6_sync_pairs"]
+    fixed = current_key in catalog["step6_fixed_subitems"]
+    block = catalog["step6_items"][current_key]
+    selections = st.session_state.step6_selections
+
+    submitted = {}
+    for sub_key in block.get("subitems", {}):
+        full_key = f"{current_key}_sub_{sub_key}"
+        submitted[full_key] = "변경 있음" if fixed else st.session_state[full_key]
+    for req_key in block.get("requirements", {}):
+        full_key = f"{current_key}_req_{req_key}"
+        submitted[full_key] = st.session_state[full_key]
+
+    # 동기화 쌍 : 두 라디오 값이 다르면 이번 제출에서 바뀐 쪽을 따른다
+    mirrored = {}
+    for sub_key in block.get("subitems", {}):
+        if fixed or sub_key not in step6_sync_pairs:
+            continue
+        full_key = f"{current_key}_sub_{sub_key}"
+        other_key = f"{current_key}_sub_{step6_sync_pairs[sub_key]}"
+        value = submitted[full_key]
+        if value == selections.get(full_key, "변경 없음"):
+            value = submitted.get(other_key, value)
+        mirrored[full_key] = mirrored[other_key] = value
+
+    for full_key, value in {**submitted, **mirrored}.items():
+        set_step6_selection(full_key, value)
+    navigate()
+
+def render_step6_form(current_key):
+    catalog = load_artifact("catalog")
+    step6_sync_pairs = catalog["step6_sync_pairs"]
+    step6_fixed_subitems = catalog["step6_fixed_subitems"]
+    block = catalog["step6_items"][current_key]
+    selections = st.session_state.step6_selections
+
+    st.markdown(f"### {block['title']}")
+
+    with st.form(f"step6_form_{current_key}"):
+        # 하위항목
+        for sub_key, sub_text in block.get("subitems", {}).items():
+            full_key = f"{current_key}_sub_{sub_key}"
+            if current_key in step6_fixed_subitems:
+                st.radio(sub_text, ["변경 있음"], index=0, key=full_key, disabled=True)
+            else:
+                # 미응답 기본값은 항목별 화면과 같게 : 동기화 쌍만 "변경 없음", 나머지는 첫 선택지
+                default = "변경 없음" if sub_key in step6_sync_pairs else "변경 있음"
+                st.radio(
+                    sub_text,
+                    ["변경 있음", "변경 없음"],
+                    key=full_key,
+                    index=0 if selections.get(full_key, default) == "변경 있음" else 1
+                )
+
+        # 충족요건
+        for req_key, req_text in block.get("requirements", {}).items():
+            full_key = f"{current_key}_req_{req_key}"
+            st.radio(
+                f"{req_key}. {req_text}",
+                ["충족", "미충족"],
+                key=full_key,
+                index=1 if selections.get(full_key) == "미충족" else 0
+            )
+
+        # 하단 버튼 영역 (어느 쪽이든 현재 항목의 답변을 반영한 뒤 이동)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.form_submit_button(
+                "이전단계로",
+                on_click=submit_step6_page,
+                args=(
+                    current_key,
+                    go_back_to_step5 if st.session_state.step6_page == 0 else go_to_prev_step6_page,
+                ),
+            )
+        with col2:
+            if st.session_state.step6_page == len(st.session_state.step6_targets) - 1:
+                st.form_submit_button(
+                    "결과 확인하기", on_click=submit_step6_page, args=(current_key, go_to_step7)
+                )
+            else:
+                st.form_submit_button(
+                    "다음항목 선택하기",
+                    on_click=submit_step6_page,
+                    args=(current_key, go_to_next_step6_page),
+                )
+
+def render():
+    step6_items = load_artifact("catalog")["step6_items"]
+
+    st.markdown("## Step 6")
+    st.write("Step 6. Step5에서 '변경 있음'으로 선택된 항목에 대해 충족요건을 모두 선택하세요.")
+    st.toggle(
+        "항목별 일괄 제출",
+        value=st.session_state.step6_form_mode,
+        key="step6_form_mode_toggle",
+        on_change=toggle_step6_form_mode,
+    )
+
+    targets = st.session_state.step6_targets
+    if not targets:
+        st.warning("Step5에서 선택된 항목이 없습니다.")
+    else:
+        current_key = targets[st.session_state.step6_page]
+
+        if current_key in step6_items and st.session_state.step6_form_mode:
+            render_step6_form(current_key)
+            return
+        if current_key in step6_items:
+            render_step6_page(current_key)
+        else:
+            st.warning("해당 항목 정보를 찾을 수 없습니다.")
+
+        # 하단 버튼 영역 (fragment 밖 : 클릭 시 전체 재실행)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.button(
+                "이전단계로",
+                on_click=go_back_to_step5 if st.session_state.step6_page == 0 else go_to_prev_step6_page
+            )
+        with col2:
+            if st.session_state.step6_page == len(st.session_state.step6_targets) - 1:
+                st.button("결과 확인하기", on_click=go_to_step7)
+            else:
+                st.button("다음항목 선택하기", on_click=go_to_next_step6_page)
@@ -0,0 +1,65 @@
+import streamlit as st
+
+from step7_artifact import load_artifact
+from step7_engine import Step7Results, evaluate_title_key_rows
+
+
+# ===== Step 7 =====
+def render():
+    step6_items = load_artifact("catalog")["step6_items"]
+
+    if "step7_page" not in st.session_state:
+        st.session_state.step7_page = 0
+    if "step7_results" not in st.session_state:
+        st.session_state.step7_results = Step7Results()
+
+    targets = st.session_state.step6_targets
+    total_pages = len(targets)
+    st.session_state.step7_page = max(
+        0, min(st.session_state.step7_page, total_pages - 1)
+    )
+
+    if not targets:
+        st.warning("Step6에서 선택된 항목이 없습니다.")
+    else:
+        current_key = targets[st.session_state.step7_page]
+        # Step 6 에서 답변이 바뀌었거나 아직 판정하지 않은 항목만 다시 판정
+        if st.session_state.step7_results.is_dirty(current_key):
+            st.session_state.step7_results.set_rows(
+                current_key,
+                evaluate_title_key_rows(current_key, st.session_state.step6_selections),
+            )
+        results = st.session_state.step7_results[current_key]
+
+        st.markdown("## 제조방법 변경에 따른 필요서류 및 보고유형")
+        st.markdown(step6_items[current_key]["title"])
+
+        for output_1_tag, output_1_text, output_2_text in results:
+            st.markdown(output_1_text)
+            st.markdown(output_2_text)
+
+        if not results:
+            st.warning(
+                "해당 변경사항에 대한 충족조건을 고려하였을 때,\n"
+                "\u300C의약품 허가 후 제조방법 변경관리 가이드라인\u300D에서 제시하고 있는\n"
+                "범위에 해당하지 않는 것으로 확인됩니다"
+            )
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.button(
+                "이전단계로",
+                disabled=st.session_state.step7_page == 0,
+                on_click=lambda: st.session_state.__setitem__('step7_page', st.session_state.step7_page - 1)
+            )
+        with col2:
+            if st.session_state.step7_page == total_pages - 1:
+                st.button(
+                    "신청양식 확인하기",
+                    on_click=lambda: st.session_state.__setitem__('step', 8)
+                )
+            else:
+                st.button(
+                    "다음단계로",
+                    on_click=lambda: st.session_state.__setitem__('step7_page', st.session_state.step7_page + 1)
+                )
@@ -0,0 +1,60 @@
+import streamlit as st
+
+from step7_artifact import load_artifact
+from step7_engine import Step7Results, document_catalog, row_result
+from step7_summary import consolidate
+from step8_form import FORM_FILE_NAME, NO_MATCH_TEXT, form_key, form_xlsx
+
+
+# ===== Step8 함수 및 화면 =====
+def go_back_to_step7():
+    st.session_state.step = 7
+
+def render():
+    step6_items = load_artifact("catalog")["step6_items"]
+
+    if "step7_results" not in st.session_state:
+        st.session_state.step7_results = Step7Results()
+    # Step 7 진입 시 이미 완성되어 있으므로 보통은 판정 없이 통과
+    st.session_state.step7_results.refresh(
+        st.session_state.step6_targets, st.session_state.step6_selections
+    )
+
+    st.markdown("## 신청양식")
+
+    key = form_key(st.session_state.step6_targets, st.session_state.step7_results)
+    if not key:
+        st.warning("Step6에서 선택된 항목이 없습니다.")
+    else:
+        # 전체 항목의 필요서류를 중복 없이 CTD 항목별로 통합
+        summary = consolidate(row_id for _, row_ids in key for row_id in row_ids)
+        catalog = document_catalog()
+        st.markdown("### 필요서류 통합 목록")
+        if summary["report_tag"] is not None:
+            st.markdown(f"**가장 엄격한 보고유형 : {summary['report_tag']}**")
+        for section, document_ids in summary["sections"]:
+            st.markdown(f"#### {section or '기타'}")
+            st.markdown("\n".join(
+                "- " + catalog[document_id][1].replace("\n", "\n  ") for document_id in document_ids
+            ))
+
+        st.markdown("### 항목별 결과")
+        for title_key, row_ids in key:
+            st.divider()
+            st.markdown(step6_items[title_key]["title"])
+            if not row_ids:
+                st.warning(NO_MATCH_TEXT)
+            for row_id in row_ids:
+                output_1_tag, output_1_text, output_2_text = row_result(row_id)
+                st.markdown(output_1_text)
+                st.markdown(output_2_text)
+
+        # 판정 결과가 같으면 재실행·재클릭 시에도 캐시된 파일을 그대로 사용
+        st.download_button(
+            "신청양식 내려받기 (.xlsx)",
+            data=form_xlsx(key),
+            file_name=FORM_FILE_NAME,
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+
+    st.button("이전단계로", on_click=go_back_to_step7)